@@ -0,0 +1 @@
+"""Benchmarks for the VanMoof integration, run against simulated bikes."""
@@ -0,0 +1,172 @@
+"""
+Benchmark the SX3 and SX clients against simulated bikes.
+
+Each refresh does what a coordinator poll does for that client family:
+connect, authenticate (S3/X3), read every polled value and disconnect. With
+``--keep-connected`` the link and authentication are reused across refreshes,
+as with the session idle timeout option.
+
+Reported per scenario: refresh latency (p50/p95), GATT operations per refresh
+and CPU time per refresh.
+
+    python -m benchmarks.bench_clients --refreshes 50 --time-scale 0.05
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from custom_components.vanmoof.bleak_client_utils import (
+    disconnect_bleak_client,
+    prime_characteristic_cache,
+)
+from custom_components.vanmoof.const import MAX_CONCURRENT_GATT_READS
+from custom_components.vanmoof.sx3_client import SX3Client
+from custom_components.vanmoof.sx_client import SXClient
+
+from .common import print_table, summarize, write_json
+from .fake_bike import FakeBikeConnector, FakeVanMoofBike, LinkConditions
+
+# The values a coordinator poll reads from an S3/X3
+SX3_FIELDS = [
+    "battery_level",
+    "lock_state",
+    "distance_travelled",
+    "module_level",
+    "power_level",
+    "speed",
+    "light_mode",
+    "module_state",
+    "errors",
+    "motor_battery_state",
+    "module_battery_state",
+]
+
+_OPERATIONS = ("connects", "reads", "writes", "notify_requests")
+
+
+class ClientRefresher:
+    """Run refreshes of one bike the way the coordinator does."""
+
+    def __init__(self, bike: FakeVanMoofBike, connector: FakeBikeConnector, keep_connected: bool) -> None:
+        self._bike = bike
+        self._connector = connector
+        self._keep_connected = keep_connected
+        self._link = None
+        self._client: Any = None
+        self._read_slots = asyncio.Semaphore(MAX_CONCURRENT_GATT_READS)
+
+    async def _limited(self, reader):
+        async with self._read_slots:
+            return await reader()
+
+    async def refresh(self) -> Any:
+        if self._link is None or not self._link.is_connected:
+            self._link = await self._connector(self._bike.device)
+            await prime_characteristic_cache(self._link)
+            self._client = None
+
+        try:
+            if self._bike.model == "sx3":
+                if self._client is None:
+                    self._client = SX3Client(self._link, self._bike.key, self._bike.user_key_id)
+                    await self._client.authenticate()
+                return await self._client.get_many(SX3_FIELDS, limiter=self._limited)
+
+            if self._client is None:
+                self._client = SXClient(self._link, self._bike.key)
+            return await self._client.get_parameters()
+        finally:
+            if not self._keep_connected:
+                await self.close()
+
+    async def close(self) -> None:
+        link, self._link = self._link, None
+        self._client = None
+        if link is not None:
+            await disconnect_bleak_client(link)
+
+
+async def run_scenario(
+    model: str,
+    refreshes: int,
+    conditions: LinkConditions,
+    keep_connected: bool = False,
+) -> dict[str, Any]:
+    """Run ``refreshes`` refreshes of one simulated bike and return the measurements."""
+    bike = FakeVanMoofBike("AA:BB:CC:DD:EE:01", model=model, conditions=conditions)
+    refresher = ClientRefresher(bike, FakeBikeConnector([bike]), keep_connected)
+
+    latencies: list[float] = []
+    cpu_times: list[float] = []
+    failures = 0
+    for _refresh in range(refreshes):
+        started, cpu_started = time.perf_counter(), time.process_time()
+        try:
+            await refresher.refresh()
+        except Exception:
+            failures += 1
+        latencies.append((time.perf_counter() - started) * 1000)
+        cpu_times.append((time.process_time() - cpu_started) * 1000)
+    await refresher.close()
+
+    latency = summarize(latencies)
+    return {
+        "scenario": f"{model}{' keep-connected' if keep_connected else ''}",
+        "refreshes": refreshes,
+        "failures": failures,
+        "latency_p50_ms": latency["p50"],
+        "latency_p95_ms": latency["p95"],
+        "ops_per_refresh": sum(bike.stats[name] for name in _OPERATIONS) / refreshes,
+        "handshakes_per_refresh": bike.stats["handshakes"] / refreshes,
+        "cpu_ms_per_refresh": summarize(cpu_times)["mean"],
+    }
+
+
+async def main(args: argparse.Namespace) -> list[dict[str, Any]]:
+    conditions = LinkConditions(
+        connect_latency=args.connect_latency,
+        op_latency=args.op_latency,
+        op_failure_rate=args.failure_rate,
+        connect_failure_rate=args.failure_rate,
+        time_scale=args.time_scale,
+        seed=args.seed,
+    )
+    results = []
+    for model in ("sx3", "sx"):
+        for keep_connected in (False, True):
+            results.append(await run_scenario(model, args.refreshes, conditions, keep_connected))
+    return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--refreshes", type=int, default=30)
+    parser.add_argument("--connect-latency", type=float, default=0.8, help="seconds per connection")
+    parser.add_argument("--op-latency", type=float, default=0.03, help="seconds per GATT operation")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="injected connect/operation failure rate")
+    parser.add_argument("--time-scale", type=float, default=1.0, help="multiply every simulated delay")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="also write the results to this file")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    measurements = asyncio.run(main(arguments))
+    print_table(
+        measurements,
+        [
+            ("scenario", "scenario"),
+            ("latency_p50_ms", "p50 ms"),
+            ("latency_p95_ms", "p95 ms"),
+            ("ops_per_refresh", "ops/refresh"),
+            ("handshakes_per_refresh", "auth/refresh"),
+            ("cpu_ms_per_refresh", "cpu ms"),
+            ("failures", "failures"),
+        ],
+    )
+    if arguments.json:
+        write_json(arguments.json, measurements)
@@ -0,0 +1,307 @@
+"""
+Benchmark coordinator refreshes against simulated bikes.
+
+Every scenario sets up real ``VanMoofDataUpdateCoordinator`` instances on a
+Home Assistant core, with Bluetooth and GATT connections served by
+``FakeBluetooth`` and ``FakeBikeConnector``, and times ``async_refresh``.
+
+Reported per scenario: refresh latency (p50/p95), GATT operations per refresh,
+simulated connect and GATT time per refresh, data fields changed per refresh
+(the entities that write state), CPU time per refresh and event loop blocking
+time per refresh.
+
+    python -m benchmarks.bench_coordinator
+    python -m benchmarks.bench_coordinator --write-baseline benchmarks/baseline.json
+    python -m benchmarks.bench_coordinator --baseline benchmarks/baseline.json
+
+With ``--baseline`` the run exits with status 1 when a gated metric regressed
+by more than the tolerance.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import json
+import logging
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.vanmoof.const import (
+    CONF_SESSION_IDLE_TIMEOUT,
+    DOMAIN,
+    PRESENCE_TIMEOUT,
+)
+from custom_components.vanmoof.transport import async_set_gatt_connector
+from custom_components.vanmoof.vanmoof_coordinator import VanMoofDataUpdateCoordinator
+
+from .common import print_table, summarize, write_json
+from .fake_bike import FakeBikeConnector, FakeVanMoofBike, LinkConditions
+from .fake_bluetooth import FakeBluetooth
+
+_OPERATIONS = ("connects", "reads", "writes", "notify_requests")
+_GATT_OPERATIONS = ("reads", "writes", "notify_requests")
+
+# Gated metric: (relative tolerance multiplier, absolute slack)
+_GATES = {
+    "latency_p50_ms": (1.0, 5.0),
+    "latency_p95_ms": (1.0, 10.0),
+    "ops_per_refresh": (0.0, 0.5),
+    "blocking_ms_per_refresh": (1.0, 2.0),
+}
+
+
+@dataclass
+class Scenario:
+    """One benchmark setup."""
+
+    model: str = "sx3"
+    vanmoof_type: str = "S3"
+    bikes: int = 1
+    absent: bool = False
+    connect_failure_rate: float = 0.0
+    op_failure_rate: float = 0.0
+    session_idle_timeout: int = 0
+
+
+SCENARIOS = {
+    "s1-fallback": Scenario(model="s1", vanmoof_type="S1"),
+    "sx-parameters": Scenario(model="sx", vanmoof_type="S2"),
+    "s3-full-read": Scenario(),
+    "s3-session": Scenario(session_idle_timeout=300),
+    "absent": Scenario(absent=True),
+    "flaky-connect": Scenario(connect_failure_rate=0.3, op_failure_rate=0.02),
+    "bikes-1": Scenario(bikes=1),
+    "bikes-5": Scenario(bikes=5),
+    "bikes-20": Scenario(bikes=20),
+}
+
+
+class LoopMonitor:
+    """
+    Measure how long the event loop is blocked: a probe task asks to wake up
+    every ``interval`` seconds and sums how late it is woken.
+    """
+
+    def __init__(self, interval: float = 0.001) -> None:
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self.blocked = 0.0
+        self.max_lag = 0.0
+
+    def start(self) -> None:
+        self._task = asyncio.get_running_loop().create_task(self._probe())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _probe(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            lag = loop.time() - expected
+            if lag > self._interval:
+                self.blocked += lag
+                self.max_lag = max(self.max_lag, lag)
+
+
+def _config_entry(bike: FakeVanMoofBike, scenario: Scenario) -> ConfigEntry:
+    arguments = {
+        "version": 1,
+        "minor_version": 1,
+        "domain": DOMAIN,
+        "title": bike.address,
+        "data": {
+            "mac_address": bike.address,
+            "encryption_key": bike.key,
+            "user_key_id": bike.user_key_id,
+            "vanmoof_type": scenario.vanmoof_type,
+            "bike_model": scenario.vanmoof_type,
+        },
+        "source": "user",
+        "options": {CONF_SESSION_IDLE_TIMEOUT: scenario.session_idle_timeout},
+        "discovery_keys": {},
+        "subentries_data": (),
+    }
+    # ConfigEntry gains required keywords across Home Assistant releases.
+    accepted = inspect.signature(ConfigEntry).parameters
+    return ConfigEntry(**{key: value for key, value in arguments.items() if key in accepted})
+
+
+async def _timed_refresh(coordinator: VanMoofDataUpdateCoordinator) -> tuple[float, bool, bool, int]:
+    started = time.perf_counter()
+    await coordinator.async_refresh()
+    elapsed = (time.perf_counter() - started) * 1000
+    present = coordinator.data is not None and coordinator.data.present
+    return elapsed, coordinator.last_update_success, present, len(coordinator.changed_fields)
+
+
+async def run_scenario(name: str, scenario: Scenario, refreshes: int, time_scale: float, seed: int) -> dict[str, Any]:
+    """Run ``refreshes`` rounds of concurrent refreshes of every bike in ``scenario``."""
+    hass = HomeAssistant(tempfile.mkdtemp(prefix="vanmoof-bench-"))
+    bikes = [
+        FakeVanMoofBike(
+            f"F0:00:00:00:{index // 256:02X}:{index % 256:02X}",
+            model=scenario.model,
+            conditions=LinkConditions(
+                connect_failure_rate=scenario.connect_failure_rate,
+                op_failure_rate=scenario.op_failure_rate,
+                time_scale=time_scale,
+                seed=seed + index,
+            ),
+        )
+        for index in range(scenario.bikes)
+    ]
+    bluetooth = FakeBluetooth(bikes)
+    monitor = LoopMonitor()
+
+    with bluetooth.patch():
+        async_set_gatt_connector(hass, FakeBikeConnector(bikes))
+        coordinators = [VanMoofDataUpdateCoordinator(hass, _config_entry(bike, scenario)) for bike in bikes]
+        for coordinator in coordinators:
+            await coordinator.async_start()
+
+        # The first advertisement flips presence and triggers a warm-up refresh.
+        bluetooth.advertise()
+        await hass.async_block_till_done()
+
+        if scenario.absent:
+            for bike in bikes:
+                bluetooth.set_in_range(bike, False)
+            for coordinator in coordinators:
+                coordinator.presence.async_expire(time.monotonic() + PRESENCE_TIMEOUT)
+
+        for bike in bikes:
+            bike.stats.clear()
+            bike.busy.clear()
+
+        latencies: list[float] = []
+        failures = not_home = changed_fields = 0
+        monitor.start()
+        cpu_started = time.process_time()
+        for _round in range(refreshes):
+            bluetooth.advertise()
+            for elapsed, success, present, changed in await asyncio.gather(
+                *(_timed_refresh(coordinator) for coordinator in coordinators)
+            ):
+                latencies.append(elapsed)
+                changed_fields += changed
+                failures += not success
+                not_home += success and not present
+        cpu_time = time.process_time() - cpu_started
+        await monitor.stop()
+
+        for coordinator in coordinators:
+            await coordinator.async_shutdown()
+        await hass.async_block_till_done()
+
+    await hass.async_stop(force=True)
+
+    total = refreshes * len(bikes)
+    latency = summarize(latencies)
+    return {
+        "scenario": name,
+        "refreshes": total,
+        "failures": failures,
+        "not_home": not_home,
+        "latency_p50_ms": latency["p50"],
+        "latency_p95_ms": latency["p95"],
+        "ops_per_refresh": sum(bike.stats[kind] for bike in bikes for kind in _OPERATIONS) / total,
+        "connect_ms_per_refresh": sum(bike.busy["connects"] for bike in bikes) * 1000 / total,
+        "gatt_ms_per_refresh": sum(bike.busy[kind] for bike in bikes for kind in _GATT_OPERATIONS) * 1000 / total,
+        "changed_fields_per_refresh": changed_fields / total,
+        "cpu_ms_per_refresh": cpu_time * 1000 / total,
+        "blocking_ms_per_refresh": monitor.blocked * 1000 / total,
+        "max_blocking_ms": monitor.max_lag * 1000,
+    }
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """Return a description of every gated metric that regressed against ``baseline``."""
+    regressions = []
+    if results["settings"] != baseline.get("settings"):
+        print("warning: baseline was recorded with different settings", file=sys.stderr)
+
+    for name, metrics in results["scenarios"].items():
+        reference = baseline.get("scenarios", {}).get(name)
+        if reference is None:
+            continue
+        for metric, (relative, slack) in _GATES.items():
+            limit = reference[metric] * (1 + tolerance * relative) + slack
+            if metrics[metric] > limit:
+                regressions.append(
+                    f"{name}: {metric} {metrics[metric]:.2f} > {limit:.2f} (baseline {reference[metric]:.2f})"
+                )
+    return regressions
+
+
+async def main(args: argparse.Namespace) -> dict[str, Any]:
+    names = args.scenario or list(SCENARIOS)
+    scenarios = {}
+    for name in names:
+        scenarios[name] = await run_scenario(name, SCENARIOS[name], args.refreshes, args.time_scale, args.seed)
+    return {
+        "settings": {"refreshes": args.refreshes, "time_scale": args.time_scale, "seed": args.seed},
+        "scenario_definitions": {name: asdict(SCENARIOS[name]) for name in names},
+        "scenarios": scenarios,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS), help="run only these scenarios")
+    parser.add_argument("--refreshes", type=int, default=20, help="refresh rounds per scenario")
+    parser.add_argument("--time-scale", type=float, default=0.05, help="multiply every simulated delay")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="fail when a gated metric regressed against this file")
+    parser.add_argument("--write-baseline", help="write the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--verbose", action="store_true", help="show integration logging")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    arguments = parse_args()
+    logging.basicConfig(level=logging.DEBUG if arguments.verbose else logging.CRITICAL)
+    results = asyncio.run(main(arguments))
+    print_table(
+        list(results["scenarios"].values()),
+        [
+            ("scenario", "scenario"),
+            ("latency_p50_ms", "p50 ms"),
+            ("latency_p95_ms", "p95 ms"),
+            ("ops_per_refresh", "ops"),
+            ("connect_ms_per_refresh", "connect ms"),
+            ("gatt_ms_per_refresh", "gatt ms"),
+            ("changed_fields_per_refresh", "changed"),
+            ("cpu_ms_per_refresh", "cpu ms"),
+            ("blocking_ms_per_refresh", "blocked ms"),
+            ("max_blocking_ms", "max block"),
+            ("failures", "failed"),
+            ("not_home", "not home"),
+        ],
+    )
+
+    for path in (arguments.json, arguments.write_baseline):
+        if path:
+            write_json(path, results)
+
+    if arguments.baseline:
+        with open(arguments.baseline, encoding="utf-8") as handle:
+            problems = compare(results, json.load(handle), arguments.tolerance)
+        for problem in problems:
+            print(f"REGRESSION {problem}", file=sys.stderr)
+        sys.exit(1 if problems else 0)
@@ -0,0 +1,50 @@
+"""Shared helpers for the benchmark scripts."""
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Sequence
+from typing import Any
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    """Return the nearest-rank percentile of ``values``."""
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(values: Sequence[float]) -> dict[str, float]:
+    """Return p50, p95 and mean of ``values``."""
+    return {
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "mean": sum(values) / len(values) if values else math.nan,
+    }
+
+
+def print_table(rows: list[dict[str, Any]], columns: list[tuple[str, str]]) -> None:
+    """Print ``rows`` as an aligned text table; ``columns`` are (key, heading) pairs."""
+    cells = [[heading for _key, heading in columns]]
+    for row in rows:
+        cells.append([_format(row.get(key)) for key, _heading in columns])
+    widths = [max(len(line[index]) for line in cells) for index in range(len(columns))]
+    for number, line in enumerate(cells):
+        print("  ".join(
+            cell.rjust(width) if number and index else cell.ljust(width)
+            for index, (cell, width) in enumerate(zip(line, widths))
+        ))
+
+
+def _format(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    return "" if value is None else str(value)
+
+
+def write_json(path: str, results: Any) -> None:
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(results, handle, indent=2, sort_keys=True)
+        handle.write("\n")
@@ -0,0 +1,496 @@
+"""
+In-memory VanMoof peripherals that implement the ``GattTransport`` protocol.
+
+``FakeVanMoofBike`` holds the state of one simulated bike: its GATT table
+(S3/X3, SX or S1), the plaintext characteristic values and the challenge nonce.
+``FakeBikeConnector`` is a drop-in ``GattConnector``; every connection returns a
+``FakeGattLink`` with its own authentication state, so reconnecting costs a new
+handshake just like on a real bike.
+
+Latency and failures are injected through ``LinkConditions``.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import struct
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+from custom_components.vanmoof.bleak_client_utils import clear_characteristic_cache
+from custom_components.vanmoof.sx3_profile import SX3Profile
+from custom_components.vanmoof.sx_profile import SXProfile
+
+BATTERY_SERVICE = "0000180f-0000-1000-8000-00805f9b34fb"
+BATTERY_LEVEL = "00002a19-0000-1000-8000-00805f9b34fb"
+
+# Same layout as sx_client._PARAMETERS
+_SX_PARAMETERS = struct.Struct("<2xBBxBBBBBxIB")
+
+_SX3_SERVICES = (
+    SX3Profile.Security,
+    SX3Profile.Defense,
+    SX3Profile.Movement,
+    SX3Profile.BikeInfo,
+    SX3Profile.BikeState,
+    SX3Profile.Sound,
+    SX3Profile.Light,
+)
+
+# S3/X3 characteristics that are exchanged in the clear
+_SX3_PLAINTEXT = {
+    SX3Profile.Security.CHALLENGE.value,
+    SX3Profile.Security.KEY_INDEX.value,
+    SX3Profile.BikeInfo.FRAME_NUMBER.value,
+}
+
+
+class FakeGattError(Exception):
+    """Raised by the simulated peripheral where bleak would raise ``BleakError``."""
+
+
+@dataclass
+class LinkConditions:
+    """
+    Radio conditions of a simulated link. Latencies are in seconds; ``jitter`` is
+    the relative spread applied to every latency. ``time_scale`` shrinks all
+    delays, e.g. ``0.01`` to run a benchmark a hundred times faster.
+    """
+
+    connect_latency: float = 0.8
+    op_latency: float = 0.03
+    jitter: float = 0.2
+    connect_failure_rate: float = 0.0
+    op_failure_rate: float = 0.0
+    link_drop_rate: float = 0.0
+    serialize_ops: bool = True
+    time_scale: float = 1.0
+    seed: int | None = None
+
+
+class FakeCharacteristic:
+    """A characteristic in the simulated GATT table."""
+
+    __slots__ = ("uuid", "handle", "service_uuid")
+
+    def __init__(self, uuid: str, handle: int, service_uuid: str) -> None:
+        self.uuid = uuid
+        self.handle = handle
+        self.service_uuid = service_uuid
+
+    def __repr__(self) -> str:
+        return f"FakeCharacteristic({self.uuid}, handle={self.handle})"
+
+
+class FakeService:
+    """A service in the simulated GATT table."""
+
+    def __init__(self, uuid: str) -> None:
+        self.uuid = uuid
+        self.characteristics: list[FakeCharacteristic] = []
+
+    def get_characteristic(self, uuid: str) -> FakeCharacteristic | None:
+        uuid = str(uuid).lower()
+        for characteristic in self.characteristics:
+            if characteristic.uuid == uuid:
+                return characteristic
+        return None
+
+
+class FakeServices:
+    """The simulated GATT table, shaped like ``BleakGATTServiceCollection``."""
+
+    def __init__(self, table: dict[str, list[str]]) -> None:
+        self._services: dict[str, FakeService] = {}
+        self._characteristics: dict[str, FakeCharacteristic] = {}
+        handle = 1
+        for service_uuid, characteristic_uuids in table.items():
+            service = self._services[service_uuid] = FakeService(service_uuid)
+            for uuid in characteristic_uuids:
+                characteristic = FakeCharacteristic(uuid, handle, service_uuid)
+                service.characteristics.append(characteristic)
+                self._characteristics[uuid] = characteristic
+                handle += 1
+
+    def __iter__(self):
+        return iter(self._services.values())
+
+    def get_service(self, uuid: str) -> FakeService | None:
+        return self._services.get(str(uuid).lower())
+
+    def get_characteristic(self, specifier: Any) -> FakeCharacteristic | None:
+        if isinstance(specifier, FakeCharacteristic):
+            return specifier
+        return self._characteristics.get(str(specifier).lower())
+
+
+def _profile_table(services) -> dict[str, list[str]]:
+    return {
+        service.SERVICE_UUID.value: [
+            member.value for name, member in service.__members__.items() if name != "SERVICE_UUID"
+        ]
+        for service in services
+    }
+
+
+def _pad(data: bytes) -> bytes:
+    return bytes(data) + bytes(-len(data) % 16)
+
+
+class FakeBleDevice:
+    """The parts of a ``BLEDevice`` the integration reads."""
+
+    __slots__ = ("address", "name", "details", "rssi")
+
+    def __init__(self, address: str, name: str | None = None, source: str = "fake-adapter", rssi: int = -60) -> None:
+        self.address = address
+        self.name = name
+        self.details = {"source": source}
+        self.rssi = rssi
+
+
+class FakeVanMoofBike:
+    """
+    A simulated bike.
+
+    :param model: ``"sx3"`` (S3/X3, encrypted per characteristic with a nonce
+        handshake), ``"sx"`` (S/X, one encrypted ``PARAMETERS`` characteristic)
+        or ``"s1"`` (standard battery service only).
+    :param key: Hex encryption key, as stored in the config entry.
+    :param user_key_id: User key id expected by the S3/X3 handshake.
+    :param rotate_challenge: Whether every write replaces the challenge nonce.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        model: str = "sx3",
+        key: str | None = None,
+        user_key_id: int = 1,
+        conditions: LinkConditions | None = None,
+        rotate_challenge: bool = True,
+    ) -> None:
+        self.address = address
+        self.model = model
+        self.key = key or os.urandom(16).hex()
+        self.user_key_id = user_key_id
+        self.conditions = conditions or LinkConditions()
+        self.rotate_challenge = rotate_challenge
+        self.stats: Counter[str] = Counter()
+        # Simulated seconds spent per operation kind, after time scaling
+        self.busy: Counter[str] = Counter()
+        self.random = random.Random(self.conditions.seed)
+        self.links: list[FakeGattLink] = []
+
+        self.battery_level = 80
+        self.module_level = 90
+        self.lock_state = 1
+        self.distance = 1234.5
+        self.power_level = 2
+        self.speed = 0
+        self.light_mode = 0
+        self.module_state = 0
+        self.errors = 0
+        self.charging = False
+        self.region = 1
+        self.motor_battery_state = 0
+        self.module_battery_state = 0
+        self.frame_number = "ASY1234567"
+        self._challenge = self._new_challenge()
+
+        if model == "sx3":
+            self.services = FakeServices(_profile_table(_SX3_SERVICES))
+            self._cipher = Cipher(algorithms.AES(bytes.fromhex(self.key)), modes.ECB())
+        elif model == "sx":
+            self.services = FakeServices(_profile_table((SXProfile.Bike,)))
+            key_bytes = bytes.fromhex(self.key)
+            if len(key_bytes) == 17:
+                key_bytes = key_bytes[1:]
+            elif len(key_bytes) < 16:
+                key_bytes = key_bytes.rjust(16, b"\0")
+            self._cipher = Cipher(algorithms.AES(key_bytes), modes.ECB())
+        elif model == "s1":
+            self.services = FakeServices({BATTERY_SERVICE: [BATTERY_LEVEL]})
+            self._cipher = None
+        else:
+            raise ValueError(f"Unknown bike model {model!r}")
+
+    @property
+    def device(self) -> FakeBleDevice:
+        """Return a BLE device for this bike."""
+        return FakeBleDevice(self.address, f"VANMOOF-{self.address.replace(':', '')[-6:]}")
+
+    def _new_challenge(self) -> bytes:
+        return self.random.getrandbits(16).to_bytes(2, "little")
+
+    def _encrypt(self, data: bytes) -> bytes:
+        encryptor = self._cipher.encryptor()
+        return encryptor.update(_pad(data)) + encryptor.finalize()
+
+    def _decrypt(self, data: bytes) -> bytes:
+        decryptor = self._cipher.decryptor()
+        return decryptor.update(bytes(data)) + decryptor.finalize()
+
+    def plaintext(self, uuid: str) -> bytes:
+        """Return the plaintext value of a characteristic."""
+        if self.model == "s1":
+            return bytes([self.battery_level])
+        if self.model == "sx":
+            return self._sx_value(uuid)
+        return self._sx3_value(uuid)
+
+    def _sx_value(self, uuid: str) -> bytes:
+        if uuid == SXProfile.Bike.CHALLENGE.value:
+            return self._challenge
+        if uuid == SXProfile.Bike.PARAMETERS.value:
+            flags = (self.errors << 3) & 0xF8 | (1 if self.charging else 0)
+            return _SX_PARAMETERS.pack(
+                self.module_state,
+                self.lock_state,
+                self.battery_level,
+                self.module_level,
+                self.light_mode,
+                self.power_level,
+                self.region,
+                int(round(self.distance * 10)),
+                flags,
+            )
+        return b""
+
+    def _sx3_value(self, uuid: str) -> bytes:
+        profile = SX3Profile
+        values = {
+            profile.Security.CHALLENGE.value: lambda: self._challenge,
+            profile.Defense.LOCK_STATE.value: lambda: bytes([self.lock_state]),
+            profile.Movement.DISTANCE.value: lambda: int(round(self.distance * 10)).to_bytes(4, "little"),
+            profile.Movement.SPEED.value: lambda: bytes([self.speed]),
+            profile.Movement.POWER_LEVEL.value: lambda: bytes([self.power_level]),
+            profile.BikeInfo.MOTOR_BATTERY_LEVEL.value: lambda: bytes([self.battery_level]),
+            profile.BikeInfo.MOTOR_BATTERY_STATE.value: lambda: bytes([self.motor_battery_state]),
+            profile.BikeInfo.MODULE_BATTERY_LEVEL.value: lambda: bytes([self.module_level]),
+            profile.BikeInfo.MODULE_BATTERY_STATE.value: lambda: bytes([self.module_battery_state]),
+            profile.BikeInfo.FRAME_NUMBER.value: lambda: self.frame_number.encode("ascii"),
+            profile.BikeState.MODULE_STATE.value: lambda: bytes([self.module_state]),
+            profile.BikeState.ERRORS.value: lambda: self.errors.to_bytes(2, "little"),
+            profile.Light.LIGHT_MODE.value: lambda: bytes([self.light_mode]),
+        }
+        value = values.get(uuid)
+        return value() if value is not None else bytes(1)
+
+    def read(self, uuid: str, authenticated: bool) -> bytes:
+        """Return the over-the-air value of a characteristic."""
+        plaintext = self.plaintext(uuid)
+        if self.model == "s1" or uuid in _SX3_PLAINTEXT or uuid == SXProfile.Bike.CHALLENGE.value:
+            return plaintext
+        if self.model == "sx3" and not authenticated:
+            raise FakeGattError("Insufficient authentication")
+        return self._encrypt(plaintext)
+
+    def authenticate(self, payload: bytes) -> None:
+        """Check an S3/X3 ``KEY_INDEX`` payload against the current challenge."""
+        if len(payload) != 20 or payload[-1] != self.user_key_id:
+            raise FakeGattError("Invalid authentication payload")
+        if self._decrypt(payload[:16])[:2] != self._challenge:
+            raise FakeGattError("Authentication with a stale challenge")
+        self.stats["handshakes"] += 1
+
+    def write(self, uuid: str, payload: bytes) -> None:
+        """Apply an encrypted S3/X3 command signed with the current challenge."""
+        if len(payload) % 16:
+            raise FakeGattError("Payload is not block aligned")
+        data = self._decrypt(payload)
+        if data[:2] != self._challenge:
+            raise FakeGattError("Invalid nonce")
+
+        if uuid == SX3Profile.Defense.LOCK_STATE.value:
+            self.set_value("lock_state", data[2])
+        elif uuid == SX3Profile.Movement.POWER_LEVEL.value:
+            self.set_value("power_level", data[2])
+
+        if self.rotate_challenge:
+            self._challenge = self._new_challenge()
+
+    def set_value(self, name: str, value: Any) -> None:
+        """Change a bike value and notify the links subscribed to it."""
+        setattr(self, name, value)
+        uuid = {
+            "lock_state": SX3Profile.Defense.LOCK_STATE.value,
+            "speed": SX3Profile.Movement.SPEED.value,
+            "battery_level": SX3Profile.BikeInfo.MOTOR_BATTERY_LEVEL.value,
+        }.get(name)
+        if uuid is None or self.model != "sx3":
+            return
+        for link in list(self.links):
+            link.notify(uuid)
+
+    def drop_links(self) -> None:
+        """Drop every open connection, as when the bike goes to sleep."""
+        for link in list(self.links):
+            link.drop()
+
+
+class FakeGattLink:
+    """One connection to a ``FakeVanMoofBike``; satisfies ``GattTransport``."""
+
+    def __init__(self, bike: FakeVanMoofBike, disconnected_callback: Callable[[Any], None] | None) -> None:
+        self._bike = bike
+        self._disconnected_callback = disconnected_callback
+        self._connected = True
+        self._authenticated = bike.model != "sx3"
+        self._notify: dict[str, Callable[[Any, bytearray], None]] = {}
+        self._att_lock = asyncio.Lock()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._connected
+
+    @property
+    def services(self) -> FakeServices:
+        return self._bike.services
+
+    @property
+    def address(self) -> str:
+        return self._bike.address
+
+    async def _operation(self, kind: str) -> None:
+        bike = self._bike
+        conditions = bike.conditions
+        if not self._connected:
+            raise FakeGattError("Not connected")
+
+        bike.stats[kind] += 1
+        delay = conditions.op_latency * (1 + bike.random.uniform(-conditions.jitter, conditions.jitter))
+        bike.busy[kind] += delay * conditions.time_scale
+        if conditions.serialize_ops:
+            # ATT allows one outstanding request per link.
+            async with self._att_lock:
+                await asyncio.sleep(delay * conditions.time_scale)
+        else:
+            await asyncio.sleep(delay * conditions.time_scale)
+
+        if bike.random.random() < conditions.link_drop_rate:
+            self.drop()
+            raise FakeGattError("Link lost")
+        if bike.random.random() < conditions.op_failure_rate:
+            bike.stats["failures"] += 1
+            raise FakeGattError(f"Injected {kind} failure")
+
+    def _characteristic(self, specifier: Any) -> FakeCharacteristic:
+        if isinstance(specifier, int):
+            for service in self._bike.services:
+                for characteristic in service.characteristics:
+                    if characteristic.handle == specifier:
+                        return characteristic
+        characteristic = self._bike.services.get_characteristic(specifier)
+        if characteristic is None:
+            raise FakeGattError(f"Characteristic {specifier} was not found!")
+        return characteristic
+
+    async def read_gatt_char(self, char_specifier: Any, **kwargs: Any) -> bytearray:
+        characteristic = self._characteristic(char_specifier)
+        await self._operation("reads")
+        return bytearray(self._bike.read(characteristic.uuid, self._authenticated))
+
+    async def write_gatt_char(self, char_specifier: Any, data: bytes, response: bool = False) -> None:
+        characteristic = self._characteristic(char_specifier)
+        await self._operation("writes")
+        if characteristic.uuid == SX3Profile.Security.KEY_INDEX.value:
+            self._bike.authenticate(bytes(data))
+            self._authenticated = True
+            return
+        if not self._authenticated:
+            raise FakeGattError("Insufficient authentication")
+        self._bike.write(characteristic.uuid, bytes(data))
+
+    async def start_notify(self, char_specifier: Any, callback: Callable[[Any, bytearray], None], **kwargs: Any) -> None:
+        characteristic = self._characteristic(char_specifier)
+        await self._operation("notify_requests")
+        self._notify[characteristic.uuid] = callback
+
+    async def stop_notify(self, char_specifier: Any) -> None:
+        characteristic = self._characteristic(char_specifier)
+        await self._operation("notify_requests")
+        self._notify.pop(characteristic.uuid, None)
+
+    def notify(self, uuid: str) -> None:
+        callback = self._notify.get(uuid)
+        if callback is None or not self._connected:
+            return
+        self._bike.stats["notifications"] += 1
+        characteristic = self._bike.services.get_characteristic(uuid)
+        asyncio.get_running_loop().call_soon(
+            callback, characteristic, bytearray(self._bike.read(uuid, self._authenticated))
+        )
+
+    async def disconnect(self) -> bool:
+        if self._connected:
+            self._bike.stats["disconnects"] += 1
+            self._close()
+        return True
+
+    def drop(self) -> None:
+        """Lose the link without a disconnect request."""
+        if not self._connected:
+            return
+        self._bike.stats["drops"] += 1
+        self._close()
+        clear_characteristic_cache(self)
+        if self._disconnected_callback is not None:
+            self._disconnected_callback(self)
+
+    def _close(self) -> None:
+        self._connected = False
+        self._notify.clear()
+        if self in self._bike.links:
+            self._bike.links.remove(self)
+
+
+class FakeBikeConnector:
+    """
+    A ``GattConnector`` that opens links to simulated bikes by address, with
+    the connect latency, failures and retries of ``connect_bleak_client``.
+    """
+
+    def __init__(self, bikes: list[FakeVanMoofBike] | None = None) -> None:
+        self.bikes: dict[str, FakeVanMoofBike] = {}
+        for bike in bikes or ():
+            self.add(bike)
+
+    def add(self, bike: FakeVanMoofBike) -> None:
+        self.bikes[bike.address.lower()] = bike
+
+    async def __call__(
+        self,
+        device: Any,
+        disconnected_callback: Callable[[Any], None] | None = None,
+        ble_device_callback: Callable[[], Any] | None = None,
+        max_attempts: int = 3,
+    ) -> FakeGattLink:
+        last_err: Exception | None = None
+        for _attempt in range(max(max_attempts, 1)):
+            if ble_device_callback is not None:
+                device = ble_device_callback()
+            bike = self.bikes.get(device.address.lower())
+            if bike is None:
+                raise FakeGattError(f"Device {device.address} was not found")
+
+            conditions = bike.conditions
+            bike.stats["connects"] += 1
+            delay = conditions.connect_latency * (1 + bike.random.uniform(-conditions.jitter, conditions.jitter))
+            bike.busy["connects"] += delay * conditions.time_scale
+            await asyncio.sleep(delay * conditions.time_scale)
+            if bike.random.random() < conditions.connect_failure_rate:
+                bike.stats["connect_failures"] += 1
+                last_err = FakeGattError(f"Failed to connect to {device.address}")
+                continue
+
+            link = FakeGattLink(bike, disconnected_callback)
+            bike.links.append(link)
+            return link
+
+        raise last_err
@@ -0,0 +1,103 @@
+"""
+A simulated Home Assistant Bluetooth backend for the simulated bikes.
+
+``FakeBluetooth.patch()`` replaces the ``homeassistant.components.bluetooth``
+functions that ``custom_components.vanmoof.transport`` calls, so presence,
+source selection and connections run through the integration's own code while
+advertisements come from ``FakeVanMoofBike`` instances.
+"""
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Callable
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+from .fake_bike import FakeBleDevice, FakeVanMoofBike
+
+_BLUETOOTH = "homeassistant.components.bluetooth"
+
+
+class FakeBluetooth:
+    """
+    Advertisements and connectable paths for a set of simulated bikes.
+
+    :param sources: Adapter or proxy names; every bike in range is seen by all of
+        them, with the RSSI dropping by 5 dB per source in list order.
+    """
+
+    def __init__(self, bikes: list[FakeVanMoofBike], sources: tuple[str, ...] = ("fake-adapter",)) -> None:
+        self.bikes = {bike.address.lower(): bike for bike in bikes}
+        self.sources = sources
+        self.in_range = set(self.bikes)
+        self._callbacks: list[Callable[[Any, Any], None]] = []
+
+    def set_in_range(self, bike: FakeVanMoofBike, in_range: bool) -> None:
+        """Move a bike into or out of reach of every adapter."""
+        if in_range:
+            self.in_range.add(bike.address.lower())
+        else:
+            self.in_range.discard(bike.address.lower())
+
+    def advertise(self, bikes: list[FakeVanMoofBike] | None = None) -> None:
+        """Deliver one advertisement from each bike in range to every subscriber."""
+        for bike in bikes or self.bikes.values():
+            if bike.address.lower() not in self.in_range:
+                continue
+            device = self._device(bike, self.sources[0])
+            service_info = SimpleNamespace(device=device, rssi=device.rssi, address=bike.address)
+            for advertisement_callback in list(self._callbacks):
+                advertisement_callback(service_info, None)
+
+    def _device(self, bike: FakeVanMoofBike, source: str) -> FakeBleDevice:
+        rssi = -60 - 5 * self.sources.index(source)
+        return FakeBleDevice(bike.address, bike.device.name, source, rssi)
+
+    def async_register_callback(self, hass, advertisement_callback, matcher=None, mode=None):
+        self._callbacks.append(advertisement_callback)
+
+        def _remove() -> None:
+            self._callbacks.remove(advertisement_callback)
+
+        return _remove
+
+    def async_scanner_devices_by_address(self, hass, address: str, connectable: bool = True) -> list:
+        if address.lower() not in self.in_range:
+            return []
+        bike = self.bikes[address.lower()]
+        devices = []
+        for source in self.sources:
+            device = self._device(bike, source)
+            devices.append(
+                SimpleNamespace(
+                    scanner=SimpleNamespace(source=source),
+                    ble_device=device,
+                    advertisement=SimpleNamespace(rssi=device.rssi),
+                )
+            )
+        return devices
+
+    def async_ble_device_from_address(self, hass, address: str, connectable: bool = True):
+        if address.lower() not in self.in_range:
+            return None
+        return self._device(self.bikes[address.lower()], self.sources[0])
+
+    def async_discovered_service_info(self, hass, connectable: bool = True) -> list:
+        return [
+            SimpleNamespace(device=self._device(self.bikes[address], self.sources[0]))
+            for address in self.in_range
+        ]
+
+    @contextlib.contextmanager
+    def patch(self):
+        """Route Home Assistant's Bluetooth API to this backend."""
+        with contextlib.ExitStack() as stack:
+            for name in (
+                "async_register_callback",
+                "async_scanner_devices_by_address",
+                "async_ble_device_from_address",
+                "async_discovered_service_info",
+            ):
+                stack.enter_context(patch(f"{_BLUETOOTH}.{name}", getattr(self, name)))
+            yield self
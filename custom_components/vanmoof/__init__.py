@@ -9,7 +9,8 @@ from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import UpdateFailed
 from homeassistant.helpers import device_registry as dr
 
-from .const import DOMAIN
+from .const import CONF_BACKGROUND_STARTUP, DEFAULT_BACKGROUND_STARTUP, DOMAIN
+from .snapshot_store import async_get_snapshot_store
 from .vanmoof_coordinator import VanMoofDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -38,13 +39,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         sw_version=None,
     )
 
+    # Stored readings and learned models seed the coordinator.
+    await async_get_snapshot_store(hass).async_load()
     coordinator = VanMoofDataUpdateCoordinator(hass, entry)
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    try:
-        await coordinator.async_config_entry_first_refresh()
-    except UpdateFailed as err:
-        _LOGGER.warning("Initial VanMoof bike update failed: %s", err)
+    if coordinator.async_restore_snapshot():
+        _LOGGER.debug(
+            "Restored the state of VanMoof bike %s from %s.",
+            entry.data["mac_address"],
+            coordinator.last_reading,
+        )
+
+    # Subscribing replays recent advertisements, which may mark the restored bike present.
+    await coordinator.async_start()
+
+    if entry.options.get(CONF_BACKGROUND_STARTUP, DEFAULT_BACKGROUND_STARTUP):
+        # The first refresh can take tens of seconds of scanning and connecting;
+        # don't hold up Home Assistant startup for it.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} first refresh {entry.entry_id}"
+        )
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except UpdateFailed as err:
+            _LOGGER.warning("Initial VanMoof bike update failed: %s", err)
 
     # Listen for options update
     entry.async_on_unload(entry.add_update_listener(async_update_listener))
@@ -70,6 +90,15 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = all(unload_results)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if coordinator is not None:
+            await coordinator.async_shutdown()
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the stored state of a removed VanMoof bike."""
+    store = async_get_snapshot_store(hass)
+    await store.async_load()
+    store.async_remove(entry.entry_id)
@@ -1,10 +1,17 @@
 import logging
+import weakref
 import bleak.backends.client
 from bleak import BleakClient
+from bleak.backends.device import BLEDevice
+from bleak_retry_connector import BleakClientWithServiceCache, establish_connection
+from collections.abc import Callable
 from typing import Any
 
 _LOGGER = logging.getLogger(__name__)
 
+# Resolved characteristics per connected client, keyed by lower-case UUID
+_characteristic_cache: "weakref.WeakKeyDictionary[Any, dict[str, Any]]" = weakref.WeakKeyDictionary()
+
 
 def _uuid_value(characteristic_uuid: Any) -> str:
     if hasattr(characteristic_uuid, "value"):
@@ -38,36 +45,106 @@ async def _resolve_characteristic(gatt_client: bleak.backends.client.BaseBleakCl
     return service.get_characteristic(uuid)
 
 
-async def connect_bleak_client(device, timeout: float = 20.0) -> BleakClient:
-    """Connect to a BLE device with a fallback from device object to address."""
-    client = BleakClient(device)
+async def cache_characteristics(gatt_client: bleak.backends.client.BaseBleakClient) -> None:
+    """Index every characteristic of a connected client by UUID."""
+    services = await _get_services(gatt_client)
+    _characteristic_cache[gatt_client] = {
+        str(characteristic.uuid).lower(): characteristic
+        for service in services
+        for characteristic in service.characteristics
+    }
+
+
+def clear_characteristic_cache(gatt_client: bleak.backends.client.BaseBleakClient) -> None:
+    """Forget the characteristics resolved for a client."""
+    _characteristic_cache.pop(gatt_client, None)
+
+
+def _cached_characteristic(gatt_client: bleak.backends.client.BaseBleakClient, uuid: str):
+    handles = _characteristic_cache.get(gatt_client)
+    if handles is None:
+        return None
+    return handles.get(uuid.lower())
+
+
+def _remember_characteristic(gatt_client: bleak.backends.client.BaseBleakClient, uuid: str, characteristic) -> None:
+    if characteristic is None or isinstance(characteristic, str):
+        return
     try:
-        await client.connect(timeout=timeout)
-        return client
-    except Exception as first_exc:
-        _LOGGER.debug("BleakClient(device) connection failed: %s", first_exc)
-        try:
-            await client.disconnect()
-        except Exception:
-            pass
-
-    fallback_target = getattr(device, "address", device)
-    client = BleakClient(fallback_target)
-    await client.connect(timeout=timeout)
+        handles = _characteristic_cache.setdefault(gatt_client, {})
+    except TypeError:
+        return
+    handles[uuid.lower()] = characteristic
+
+
+async def _lookup_characteristic(gatt_client: bleak.backends.client.BaseBleakClient, characteristic_uuid: Any):
+    """Return the cached characteristic, resolving and caching it through its service if needed."""
+    uuid = _uuid_value(characteristic_uuid)
+    characteristic = _cached_characteristic(gatt_client, uuid)
+    if characteristic is None:
+        characteristic = await _resolve_characteristic(gatt_client, characteristic_uuid)
+        _remember_characteristic(gatt_client, uuid, characteristic)
+    return characteristic
+
+
+async def disconnect_bleak_client(gatt_client: bleak.backends.client.BaseBleakClient) -> None:
+    """Disconnect a client and drop its cached characteristics."""
+    clear_characteristic_cache(gatt_client)
+    await gatt_client.disconnect()
+
+
+async def connect_bleak_client(
+    device: BLEDevice,
+    disconnected_callback: Callable[[BleakClient], None] | None = None,
+    ble_device_callback: Callable[[], BLEDevice] | None = None,
+    max_attempts: int = 3,
+) -> BleakClient:
+    """
+    Connect to a BLE device with bleak-retry-connector's retry and backoff semantics.
+
+    ``ble_device_callback`` is called before every retry so the connection can move
+    to whichever adapter or proxy currently has the best path to the device.
+    Call ``prime_characteristic_cache`` afterwards to resolve every characteristic once.
+    """
+
+    def _on_disconnect(disconnected_client: BleakClient) -> None:
+        clear_characteristic_cache(disconnected_client)
+        if disconnected_callback is not None:
+            disconnected_callback(disconnected_client)
+
+    client = await establish_connection(
+        BleakClientWithServiceCache,
+        device,
+        getattr(device, "name", None) or device.address,
+        disconnected_callback=_on_disconnect,
+        max_attempts=max_attempts,
+        ble_device_callback=ble_device_callback,
+    )
     return client
 
 
+async def prime_characteristic_cache(client: BleakClient) -> None:
+    """Index the characteristics of a freshly connected client, if possible."""
+    try:
+        await cache_characteristics(client)
+    except Exception as exc:
+        _LOGGER.debug("Unable to cache characteristics after connect: %s", exc)
+
+
 async def read_from_characteristic(
     gatt_client: bleak.backends.client.BaseBleakClient,
     characteristic_uuid: Any,
 ) -> bytes:
     uuid = _uuid_value(characteristic_uuid)
+    characteristic = _cached_characteristic(gatt_client, uuid)
+    if characteristic is not None:
+        return await gatt_client.read_gatt_char(characteristic)
 
     try:
         return await gatt_client.read_gatt_char(uuid)
     except Exception as exc:
         _LOGGER.debug("Direct read_gatt_char(%s) failed: %s", uuid, exc)
-        characteristic = await _resolve_characteristic(gatt_client, characteristic_uuid)
+        characteristic = await _lookup_characteristic(gatt_client, characteristic_uuid)
         return await gatt_client.read_gatt_char(characteristic)
 
 
@@ -78,10 +155,48 @@ async def write_to_characteristic(
 ) -> None:
     uuid = _uuid_value(characteristic_uuid)
     payload = bytes(data)
+    characteristic = _cached_characteristic(gatt_client, uuid)
+    if characteristic is not None:
+        return await gatt_client.write_gatt_char(characteristic, payload, response=True)
 
     try:
         return await gatt_client.write_gatt_char(uuid, payload, response=True)
     except Exception as exc:
         _LOGGER.debug("Direct write_gatt_char(%s) failed: %s", uuid, exc)
-        characteristic = await _resolve_characteristic(gatt_client, characteristic_uuid)
+        characteristic = await _lookup_characteristic(gatt_client, characteristic_uuid)
         return await gatt_client.write_gatt_char(characteristic, payload, response=True)
+
+
+async def start_notify_on_characteristic(
+    gatt_client: bleak.backends.client.BaseBleakClient,
+    characteristic_uuid: Any,
+    callback: Callable[[Any, bytearray], None],
+) -> None:
+    uuid = _uuid_value(characteristic_uuid)
+    characteristic = _cached_characteristic(gatt_client, uuid)
+    if characteristic is not None:
+        return await gatt_client.start_notify(characteristic, callback)
+
+    try:
+        return await gatt_client.start_notify(uuid, callback)
+    except Exception as exc:
+        _LOGGER.debug("Direct start_notify(%s) failed: %s", uuid, exc)
+        characteristic = await _lookup_characteristic(gatt_client, characteristic_uuid)
+        return await gatt_client.start_notify(characteristic, callback)
+
+
+async def stop_notify_on_characteristic(
+    gatt_client: bleak.backends.client.BaseBleakClient,
+    characteristic_uuid: Any,
+) -> None:
+    uuid = _uuid_value(characteristic_uuid)
+    characteristic = _cached_characteristic(gatt_client, uuid)
+    if characteristic is not None:
+        return await gatt_client.stop_notify(characteristic)
+
+    try:
+        return await gatt_client.stop_notify(uuid)
+    except Exception as exc:
+        _LOGGER.debug("Direct stop_notify(%s) failed: %s", uuid, exc)
+        characteristic = await _lookup_characteristic(gatt_client, characteristic_uuid)
+        return await gatt_client.stop_notify(characteristic)
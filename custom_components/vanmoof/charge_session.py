@@ -0,0 +1,223 @@
+"""Charge session detection and charge curve fitting for VanMoof bikes."""
+from __future__ import annotations
+
+import math
+import time
+from typing import Any
+
+from .const import (
+    CHARGE_CV_LEVEL,
+    CHARGE_FULL_MARGIN,
+    CHARGE_SESSION_INITIAL_POLL,
+    CHARGE_SESSION_STALL,
+)
+from .snapshot import BikeSnapshot
+
+
+class _LineFit:
+    """Running least-squares fit of ``y = a + b * x``."""
+
+    __slots__ = ("count", "_x", "_y", "_xx", "_xy")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._x = self._y = self._xx = self._xy = 0.0
+
+    def add(self, x: float, y: float) -> None:
+        self.count += 1
+        self._x += x
+        self._y += y
+        self._xx += x * x
+        self._xy += x * y
+
+    def slope(self) -> float | None:
+        if self.count < 2:
+            return None
+        spread = self.count * self._xx - self._x * self._x
+        if spread <= 0:
+            return None
+        return (self.count * self._xy - self._x * self._y) / spread
+
+
+class ChargeSession:
+    """
+    One charge of the battery and its fitted charge curve.
+
+    Below ``CHARGE_CV_LEVEL`` the charger supplies constant current and the
+    level rises linearly; above it the charger holds the voltage and the
+    remaining gap to 100% shrinks exponentially. Each reading updates a running
+    line fit of the level (linear phase) or of ``ln(100 - level)`` (taper), so
+    the fit costs O(1) per reading whatever the session length.
+    """
+
+    __slots__ = (
+        "started", "start_level", "ended", "last_time", "last_level",
+        "last_rise", "_linear", "_taper",
+    )
+
+    def __init__(self, timestamp: float, level: float) -> None:
+        self.started = timestamp
+        self.start_level = level
+        self.ended: float | None = None
+        self.last_time = timestamp
+        self.last_level = level
+        self.last_rise = timestamp
+        self._linear = _LineFit()
+        self._taper = _LineFit()
+        self._fit(timestamp, level)
+
+    @property
+    def active(self) -> bool:
+        return self.ended is None
+
+    @property
+    def percent_delivered(self) -> float:
+        """Return how many battery percent the session added."""
+        return max(self.last_level - self.start_level, 0.0)
+
+    def add(self, timestamp: float, level: float) -> None:
+        if level > self.last_level:
+            self.last_rise = timestamp
+        self.last_time = timestamp
+        self.last_level = level
+        self._fit(timestamp, level)
+
+    def _fit(self, timestamp: float, level: float) -> None:
+        seconds = timestamp - self.started
+        if level < CHARGE_CV_LEVEL:
+            self._linear.add(seconds, level)
+        elif level < 100:
+            self._taper.add(seconds, math.log(100 - level))
+
+    def rate(self) -> float | None:
+        """Return the constant-current charge rate in percent per second."""
+        slope = self._linear.slope()
+        return slope if slope is not None and slope > 0 else None
+
+    def time_constant(self) -> float | None:
+        """Return the taper time constant in seconds."""
+        slope = self._taper.slope()
+        if slope is not None and slope < 0:
+            return -1 / slope
+        # Without taper readings yet, assume the taper starts at the linear rate.
+        rate = self.rate()
+        return (100 - CHARGE_CV_LEVEL) / rate if rate else None
+
+    def _seconds_to(self, level: float, target: float) -> float | None:
+        seconds = 0.0
+        if level < CHARGE_CV_LEVEL:
+            rate = self.rate()
+            if rate is None:
+                return None
+            reached = min(target, CHARGE_CV_LEVEL)
+            seconds += (reached - level) / rate
+            level = reached
+        if target > level:
+            time_constant = self.time_constant()
+            if time_constant is None:
+                return None
+            seconds += time_constant * math.log(
+                max(100 - level, CHARGE_FULL_MARGIN) / max(100 - target, CHARGE_FULL_MARGIN)
+            )
+        return seconds
+
+    def seconds_to(self, target: float, now: float | None = None) -> float | None:
+        """Return the seconds until the battery reaches ``target`` percent."""
+        if self.last_level >= target:
+            return 0.0
+        if not self.active:
+            return None
+        seconds = self._seconds_to(self.last_level, target)
+        if seconds is None:
+            return None
+        if now is None:
+            now = time.time()
+        return max(seconds - (now - self.last_time), 0.0)
+
+    def seconds_per_percent(self) -> float | None:
+        """Return the seconds the next battery percent should take."""
+        return self._seconds_to(self.last_level, min(self.last_level + 1, 100))
+
+    def as_dict(self) -> dict[str, Any]:
+        rate = self.rate()
+        time_constant = self.time_constant()
+        return {
+            "started": self.started,
+            "ended": self.ended,
+            "start_level": self.start_level,
+            "last_level": self.last_level,
+            "rate_percent_per_hour": round(rate * 3600, 2) if rate else None,
+            "taper_time_constant": round(time_constant) if time_constant else None,
+        }
+
+
+class ChargeSessionTracker:
+    """
+    Detect charge sessions of one bike from its readings.
+
+    Bikes that report a charging state (S1/S2) start and end a session with
+    it. S3/X3 bikes do not, so a session starts when the battery level rises
+    while the bike stands still. It ends when the level drops, the bike is
+    ridden, or the level has not risen for ``CHARGE_SESSION_STALL`` seconds.
+    """
+
+    def __init__(self) -> None:
+        self.session: ChargeSession | None = None
+        self._last: tuple[float, float, float | None] | None = None
+
+    @property
+    def charging(self) -> bool:
+        """Return True during a charge session."""
+        return self.session is not None and self.session.active
+
+    def add(self, data: BikeSnapshot, timestamp: float | None = None) -> None:
+        """Update the sessions with a reading of the bike."""
+        level = data.battery_level
+        if level is None:
+            return
+        if timestamp is None:
+            timestamp = time.time()
+        previous, self._last = self._last, (timestamp, level, data.distance_travelled)
+        moved = (data.speed or 0) > 0 or (
+            previous is not None
+            and data.distance_travelled is not None
+            and previous[2] is not None
+            and data.distance_travelled > previous[2]
+        )
+
+        session = self.session
+        if session is not None and session.active:
+            if (
+                (data.charging is not None and data.charging != "CHARGING")
+                or level < session.last_level
+                or moved
+                or (data.charging is None and timestamp - session.last_rise > CHARGE_SESSION_STALL)
+            ):
+                session.ended = timestamp
+            else:
+                session.add(timestamp, level)
+            return
+
+        if data.charging == "CHARGING":
+            self.session = ChargeSession(timestamp, level)
+        elif data.charging is None and not moved and previous is not None and level > previous[1]:
+            self.session = ChargeSession(previous[0], previous[1])
+            self.session.add(timestamp, level)
+
+    def poll_interval(self, target: float) -> float | None:
+        """
+        Return how soon to read the bike again during a session: once per
+        battery percent, and no later than when ``target`` is reached.
+        """
+        if not self.charging or self.session.last_level >= 100:
+            return None
+        interval = self.session.seconds_per_percent()
+        if interval is None:
+            return CHARGE_SESSION_INITIAL_POLL
+        until_target = self.session.seconds_to(target)
+        if until_target:
+            interval = min(interval, until_target)
+        return interval
+
+    def as_dict(self) -> dict[str, Any] | None:
+        return self.session.as_dict() if self.session else None
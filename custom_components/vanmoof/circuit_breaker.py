@@ -0,0 +1,75 @@
+"""Per-bike circuit breaker for unreachable VanMoof bikes."""
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Sequence
+
+from .const import CIRCUIT_BREAKER_BACKOFF, CIRCUIT_BREAKER_THRESHOLD
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class BikeCircuitBreaker:
+    """
+    Stop polling a bike that keeps being unreachable.
+
+    After ``threshold`` consecutive failures (bike not found or connect failed)
+    the circuit opens and polls are skipped for the next delay of ``backoff``;
+    every further failure moves one step along the schedule. A success, or a
+    fresh advertisement from the bike, closes the circuit again.
+
+    :param threshold: Consecutive failures before the circuit opens.
+    :param backoff: Delays in seconds, the last one repeats.
+    """
+
+    def __init__(
+        self,
+        threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+        backoff: Sequence[float] = CIRCUIT_BREAKER_BACKOFF,
+    ) -> None:
+        self._threshold = threshold
+        self._backoff = tuple(backoff)
+        self._failures = 0
+        self._open_until = 0.0
+
+    @property
+    def failures(self) -> int:
+        """Return the number of consecutive failures."""
+        return self._failures
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while polls should be skipped."""
+        return time.monotonic() < self._open_until
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the circuit allows the next attempt."""
+        return max(self._open_until - time.monotonic(), 0.0)
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful poll."""
+        self._failures = 0
+        self._open_until = 0.0
+
+    def record_failure(self) -> None:
+        """Count a failed poll and open the circuit once the threshold is reached."""
+        self._failures += 1
+        if self._failures < self._threshold:
+            return
+
+        step = min(self._failures - self._threshold, len(self._backoff) - 1)
+        delay = self._backoff[step]
+        self._open_until = time.monotonic() + delay
+        _LOGGER.debug(
+            "VanMoof bike unreachable %s times in a row; skipping polls for %s seconds.",
+            self._failures,
+            delay,
+        )
+
+    def reset(self) -> None:
+        """Close the circuit immediately, e.g. when the bike advertises again."""
+        if self._failures:
+            _LOGGER.debug("VanMoof bike seen again; closing circuit breaker.")
+        self.record_success()
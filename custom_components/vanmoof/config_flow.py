@@ -4,10 +4,19 @@ from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.helpers.httpx_client import get_async_client
 
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_BACKGROUND_STARTUP,
+    CONF_CHARGE_TARGET,
     CONF_POLLING_INTERVAL,
+    CONF_SESSION_IDLE_TIMEOUT,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_BACKGROUND_STARTUP,
+    DEFAULT_CHARGE_TARGET,
     DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SESSION_IDLE_TIMEOUT,
     DOMAIN,
     MAX_POLLING_INTERVAL,
+    MAX_SESSION_IDLE_TIMEOUT,
     MIN_POLLING_INTERVAL,
 )
 from .retrieve_encryption_key import InvalidAuth, RetrieveEncryptionKey
@@ -102,6 +111,7 @@ class VanMoofConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 # Step 3: Use the MAC address to discover and connect to the bike
                 device, client_type = await DiscoverBike.query(
+                    self.hass,
                     self.mac_address,
                     self.polling_interval,
                     self.encryption_key,
@@ -218,6 +228,18 @@ class VanMoofOptionsFlow(config_entries.OptionsFlow):
                 CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL
             ),
         )
+        current_session_idle_timeout = self._config_entry.options.get(
+            CONF_SESSION_IDLE_TIMEOUT, DEFAULT_SESSION_IDLE_TIMEOUT
+        )
+        current_adaptive_polling = self._config_entry.options.get(
+            CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+        )
+        current_background_startup = self._config_entry.options.get(
+            CONF_BACKGROUND_STARTUP, DEFAULT_BACKGROUND_STARTUP
+        )
+        current_charge_target = self._config_entry.options.get(
+            CONF_CHARGE_TARGET, DEFAULT_CHARGE_TARGET
+        )
 
         return self.async_show_form(
             step_id="init",
@@ -233,6 +255,28 @@ class VanMoofOptionsFlow(config_entries.OptionsFlow):
                             max=MAX_POLLING_INTERVAL,
                         ),
                     ),
+                    vol.Optional(
+                        CONF_SESSION_IDLE_TIMEOUT,
+                        default=current_session_idle_timeout,
+                    ): vol.All(
+                        int,
+                        vol.Range(min=0, max=MAX_SESSION_IDLE_TIMEOUT),
+                    ),
+                    vol.Optional(
+                        CONF_ADAPTIVE_POLLING,
+                        default=current_adaptive_polling,
+                    ): bool,
+                    vol.Optional(
+                        CONF_BACKGROUND_STARTUP,
+                        default=current_background_startup,
+                    ): bool,
+                    vol.Optional(
+                        CONF_CHARGE_TARGET,
+                        default=current_charge_target,
+                    ): vol.All(
+                        int,
+                        vol.Range(min=1, max=100),
+                    ),
                 }
             ),
         )
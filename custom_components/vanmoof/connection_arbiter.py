@@ -0,0 +1,151 @@
+"""Connection-slot arbitration across VanMoof bikes."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_CONNECTION_ARBITER, DEFAULT_CONNECTION_SLOTS, DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_ADAPTER = "default"
+
+
+def adapter_for_device(device) -> str:
+    """Return the adapter or proxy that would carry a connection to ``device``."""
+    details = getattr(device, "details", None)
+    if isinstance(details, dict):
+        # Home Assistant BLE devices carry the scanner source (adapter or proxy MAC).
+        source = details.get("source")
+        if source:
+            return str(source)
+
+        # BlueZ devices name their adapter in the D-Bus properties or object path.
+        adapter = (details.get("props") or {}).get("Adapter")
+        if adapter:
+            return str(adapter)
+        path = details.get("path")
+        if path and "/dev_" in path:
+            return path.split("/dev_", 1)[0]
+
+    return DEFAULT_ADAPTER
+
+
+class _AdapterSlots:
+    __slots__ = ("limit", "in_use", "waiters", "idle")
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.in_use = 0
+        self.waiters: deque[asyncio.Future] = deque()
+        # Callbacks of slot holders that only keep an idle link open
+        self.idle: list[Callable[[], None]] = []
+
+
+class ConnectionArbiter:
+    """
+    Share the few connection slots of each adapter or BLE proxy between bikes.
+
+    Callers that find every slot taken wait in first-come, first-served order
+    instead of failing to connect. Holders that only keep an idle link open
+    are asked to give their slot up as soon as someone waits for it.
+
+    :param slots_per_adapter: Simultaneous connections allowed per adapter.
+    """
+
+    def __init__(self, slots_per_adapter: int = DEFAULT_CONNECTION_SLOTS) -> None:
+        self._slots_per_adapter = slots_per_adapter
+        self._adapters: dict[str, _AdapterSlots] = {}
+
+    def _slots(self, adapter: str) -> _AdapterSlots:
+        slots = self._adapters.get(adapter)
+        if slots is None:
+            slots = self._adapters[adapter] = _AdapterSlots(self._slots_per_adapter)
+        return slots
+
+    async def async_acquire(self, adapter: str) -> None:
+        """Wait for, and take, a connection slot on ``adapter``."""
+        slots = self._slots(adapter)
+        if slots.in_use < slots.limit and not slots.waiters:
+            slots.in_use += 1
+            return
+
+        _LOGGER.debug(
+            "All %s connection slots on %s are busy; queueing behind %s waiter(s).",
+            slots.limit,
+            adapter,
+            len(slots.waiters),
+        )
+        waiter = asyncio.get_running_loop().create_future()
+        slots.waiters.append(waiter)
+        for release_idle in list(slots.idle):
+            release_idle()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled; pass it on.
+                self.release(adapter)
+            elif waiter in slots.waiters:
+                slots.waiters.remove(waiter)
+            raise
+
+    @callback
+    def release(self, adapter: str) -> None:
+        """Return a slot on ``adapter``, handing it to the longest waiter if any."""
+        slots = self._slots(adapter)
+        while slots.waiters:
+            waiter = slots.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        slots.in_use = max(slots.in_use - 1, 0)
+
+    @callback
+    def async_register_idle(self, adapter: str, release_idle: Callable[[], None]) -> Callable[[], None]:
+        """
+        Call ``release_idle`` when a caller queues for a slot on ``adapter``;
+        return a function that stops it.
+        """
+        slots = self._slots(adapter)
+        slots.idle.append(release_idle)
+
+        @callback
+        def _unregister() -> None:
+            if release_idle in slots.idle:
+                slots.idle.remove(release_idle)
+
+        return _unregister
+
+    def queue_depth(self, adapter: str | None = None) -> int:
+        """Return the number of callers waiting for a slot, on one or all adapters."""
+        if adapter is not None:
+            slots = self._adapters.get(adapter)
+            return len(slots.waiters) if slots else 0
+        return sum(len(slots.waiters) for slots in self._adapters.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return slot usage per adapter for diagnostics."""
+        return {
+            adapter: {
+                "limit": slots.limit,
+                "in_use": slots.in_use,
+                "queue_depth": len(slots.waiters),
+            }
+            for adapter, slots in self._adapters.items()
+        }
+
+
+@callback
+def async_get_connection_arbiter(hass: HomeAssistant) -> ConnectionArbiter:
+    """Return the connection arbiter shared by all VanMoof config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    arbiter = domain_data.get(DATA_CONNECTION_ARBITER)
+    if arbiter is None:
+        arbiter = domain_data[DATA_CONNECTION_ARBITER] = ConnectionArbiter()
+    return arbiter
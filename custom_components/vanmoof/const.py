@@ -2,10 +2,91 @@
 
 """Constants for VanMoof integration."""
 DOMAIN = "vanmoof"
+DATA_SCAN_BROKER = "scan_broker"
+DATA_CONNECTION_ARBITER = "connection_arbiter"
+DATA_GATT_CONNECTOR = "gatt_connector"
+DATA_SNAPSHOT_STORE = "snapshot_store"
 CONF_AUTH_KEY = "auth_key"
 CONF_USER_KEY_ID = "user_key_id"
 CONF_POLLING_INTERVAL = "polling_interval"
+CONF_SESSION_IDLE_TIMEOUT = "session_idle_timeout"
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_BACKGROUND_STARTUP = "background_startup"
+CONF_CHARGE_TARGET = "charge_target"
 
 DEFAULT_POLLING_INTERVAL = 300
 MIN_POLLING_INTERVAL = 10
 MAX_POLLING_INTERVAL = 3600
+
+# Adaptive polling: multiplier applied per idle poll while the bike is locked
+DEFAULT_ADAPTIVE_POLLING = True
+IDLE_BACKOFF_FACTOR = 1.5
+
+# Set entities up from the last known snapshot and run the first BLE refresh in the background
+DEFAULT_BACKGROUND_STARTUP = True
+
+# Seconds to keep the GATT connection open between polls; 0 disconnects after each poll
+DEFAULT_SESSION_IDLE_TIMEOUT = 0
+MAX_SESSION_IDLE_TIMEOUT = 3600
+
+# GATT reads kept in flight at once during a refresh; BLE proxies queue the rest
+MAX_CONCURRENT_GATT_READS = 3
+
+# Seconds without an advertisement before the bike is considered away
+PRESENCE_TIMEOUT = 30
+PRESENCE_CHECK_INTERVAL = 1
+# Seconds to wait for a first advertisement after the presence tracker starts
+PRESENCE_STARTUP_WAIT = 8.0
+
+# Battery readings kept to judge whether a sudden 100% report is plausible
+BATTERY_HISTORY_SIZE = 5
+BATTERY_FULL_PLAUSIBLE_FROM = 95
+
+# Consecutive unreachable polls before polling backs off, and the back-off schedule in seconds
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_BACKOFF = (60, 120, 300, 600, 1800, 3600)
+
+# Simultaneous GATT connections per adapter or BLE proxy, and how long to wait for one
+DEFAULT_CONNECTION_SLOTS = 2
+CONNECTION_SLOT_TIMEOUT = 60
+# Connection attempts through a single adapter or proxy
+DEFAULT_CONNECT_ATTEMPTS = 3
+
+# Source scoring: smoothing factor, and dB subtracted per unit failure rate and per second of connect time
+SOURCE_SCORE_SMOOTHING = 0.3
+SOURCE_FAILURE_PENALTY = 30.0
+SOURCE_LATENCY_PENALTY = 2.0
+
+# Seconds to collect bike readings before writing the last known state to storage
+SNAPSHOT_SAVE_DELAY = 60
+
+# Refreshes kept in the rolling per-phase timing histograms
+REFRESH_TIMING_WINDOW = 100
+
+# Telemetry history: raw samples kept, then (bucket seconds, buckets kept) per downsampled tier
+TELEMETRY_RAW_SAMPLES = 720
+TELEMETRY_TIERS = ((300, 288), (3600, 720))
+
+# Seconds of battery history behind the charge rate, and the least span it needs
+CHARGE_RATE_WINDOW = 1800
+CHARGE_RATE_MIN_SPAN = 300
+# Seconds of history behind the consumption estimate, and the km ridden it needs
+CONSUMPTION_WINDOW = 7 * 86400
+CONSUMPTION_MIN_DISTANCE = 1.0
+
+# Learned range: smoothing per battery percent ridden, battery percent of riding the
+# nominal range table counts as, and the plausible km per percent of a stretch
+RANGE_SMOOTHING = 0.05
+RANGE_PRIOR_WEIGHT = 20
+RANGE_KM_PER_PERCENT_LIMITS = (0.1, 5.0)
+
+# Battery percent the time-to-target sensor counts towards, e.g. where EVCC stops charging
+DEFAULT_CHARGE_TARGET = 80
+# Charge curve: battery percent where the charger switches from constant current to
+# constant voltage, and how close to 100% counts as full
+CHARGE_CV_LEVEL = 80
+CHARGE_FULL_MARGIN = 0.5
+# Seconds between polls of a charge session before its curve is fitted, and seconds
+# without a rising battery level before a session of a bike without a charging state ends
+CHARGE_SESSION_INITIAL_POLL = 60
+CHARGE_SESSION_STALL = 2700
@@ -1,10 +1,11 @@
 from homeassistant.components.device_tracker.config_entry import TrackerEntity
 from homeassistant.const import STATE_HOME, STATE_NOT_HOME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
+from .snapshot import ABSENT
 from .vanmoof_coordinator import VanMoofDataUpdateCoordinator
 
 import logging
@@ -22,6 +23,8 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
 class VanMoofDeviceTracker(CoordinatorEntity, TrackerEntity):
     """Representation of a VanMoof bike device tracker."""
 
+    _fields = ("present",)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         """Initialize the device tracker."""
         super().__init__(coordinator)
@@ -43,11 +46,17 @@ class VanMoofDeviceTracker(CoordinatorEntity, TrackerEntity):
     @property
     def state(self):
         """Return the state of the device tracker (home/not_home)."""
-        data = self.coordinator.data or {}
-        if data.get("present"):
+        data = self.coordinator.data or ABSENT
+        if data.present:
             return STATE_HOME
         return STATE_NOT_HOME
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when presence changed."""
+        if self.coordinator.fields_changed(self._fields):
+            super()._handle_coordinator_update()
+
     @property
     def source_type(self):
         """Return the source type for the device tracker."""
@@ -0,0 +1,61 @@
+"""Diagnostics support for VanMoof."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .connection_arbiter import async_get_connection_arbiter
+from .const import DOMAIN
+from .vanmoof_coordinator import VanMoofDataUpdateCoordinator
+
+TO_REDACT = {
+    "username",
+    "password",
+    "encryption_key",
+    "user_key_id",
+    "mac_address",
+    "ble_address",
+    "serial_number",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a VanMoof config entry."""
+    coordinator: VanMoofDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    presence = coordinator.presence
+    last_seen = presence.last_seen
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "data": async_redact_data(coordinator.data.as_dict(), TO_REDACT) if coordinator.data else None,
+        "stale": coordinator.stale,
+        "last_reading": coordinator.last_reading.isoformat() if coordinator.last_reading else None,
+        "update_interval": str(coordinator.update_interval),
+        "presence": {
+            "present": presence.present,
+            "rssi": presence.rssi,
+            "last_seen_seconds_ago": (
+                round(time.monotonic() - last_seen, 1) if last_seen is not None else None
+            ),
+        },
+        "circuit_breaker": {
+            "failures": coordinator.circuit_breaker.failures,
+            "open": coordinator.circuit_breaker.is_open,
+            "retry_in": round(coordinator.circuit_breaker.retry_in, 1),
+        },
+        "timings": coordinator.refresh_timings.as_dict(),
+        "telemetry": coordinator.telemetry.as_dict(),
+        "range_km_per_percent": coordinator.range_estimator.as_dict(),
+        "charge_session": coordinator.charge_sessions.as_dict(),
+        "sources": coordinator.source_scores.as_dict(),
+        "connection_slots": async_get_connection_arbiter(hass).as_dict(),
+    }
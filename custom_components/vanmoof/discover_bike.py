@@ -1,6 +1,7 @@
 import logging
-from bleak import BleakScanner
-from .bleak_client_utils import connect_bleak_client
+from homeassistant.core import HomeAssistant
+from .bleak_client_utils import connect_bleak_client, disconnect_bleak_client
+from .transport import async_ble_device_callback, async_discovered_devices
 from .sx_client import SXClient
 from .sx3_client import SX3Client
 
@@ -74,6 +75,7 @@ def _log_possible_mac_mismatch(device, mac_address: str) -> None:
 class DiscoverBike:
     @staticmethod
     async def query(
+        hass: HomeAssistant,
         mac_address: str,
         polling_interval: int,
         encryption_key: str,
@@ -85,7 +87,7 @@ class DiscoverBike:
         _LOGGER.debug(f"Starting bike discovery process for MAC address {mac_address} with polling interval {polling_interval} seconds...")
 
         try:
-            devices = await BleakScanner.discover(timeout=10.0)
+            devices = async_discovered_devices(hass)
             _LOGGER.debug(f"Discovered {len(devices)} devices.")
 
             if not devices:
@@ -101,7 +103,10 @@ class DiscoverBike:
                     # Found the device with the MAC address
                     _LOGGER.info(f"Found bike with MAC address: {device.name} ({device.address})")
 
-                    bleak_client = await connect_bleak_client(device)
+                    bleak_client = await connect_bleak_client(
+                        device,
+                        ble_device_callback=async_ble_device_callback(hass, device),
+                    )
                     _LOGGER.info(f"Successfully connected to {device.name} ({device.address})")
 
                     try:
@@ -124,7 +129,7 @@ class DiscoverBike:
                             raise
                     finally:
                         try:
-                            await bleak_client.disconnect()
+                            await disconnect_bleak_client(bleak_client)
                         except Exception:
                             pass
 
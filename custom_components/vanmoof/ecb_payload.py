@@ -0,0 +1,51 @@
+"""AES-ECB payload decryption shared by the SX and SX3 bike profiles."""
+from __future__ import annotations
+
+from typing import Any
+
+BLOCK_SIZE = 16
+
+
+def check_block_aligned(data: bytes) -> None:
+    """Raise ``ValueError`` unless ``data`` is a whole number of cipher blocks."""
+    # A reused ECB context would buffer a partial block into the next payload.
+    if len(data) % BLOCK_SIZE:
+        raise ValueError("The length of the provided data is not a multiple of the block length.")
+
+
+class EcbPayloadDecryptor:
+    """
+    Decrypt block-aligned BLE payloads with a single reused AES-ECB decryptor.
+
+    ECB carries no state between blocks, so profiles create ``self._decryptor``
+    once from their cipher and reuse it for every payload.
+    """
+
+    _decryptor: Any
+
+    def decrypt_payload(self, data: bytes) -> bytes:
+        """
+        Decrypts a Bluetooth payload.
+
+        :param data: A bytes array of data. Must be a multiple of 16 bytes long.
+        """
+        check_block_aligned(data)
+        return self._decryptor.update(data)
+
+    def decrypt_many(self, payloads: list[bytes]) -> list[bytes]:
+        """
+        Decrypts several Bluetooth payloads with a single cipher call.
+
+        :param payloads: A list of bytes arrays. Each must be a multiple of 16 bytes long.
+        :return: The decrypted payloads, in the same order.
+        """
+        for data in payloads:
+            check_block_aligned(data)
+
+        decrypted = self._decryptor.update(b"".join(payloads))
+        results = []
+        offset = 0
+        for data in payloads:
+            results.append(decrypted[offset:offset + len(data)])
+            offset += len(data)
+        return results
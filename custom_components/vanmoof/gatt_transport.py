@@ -0,0 +1,59 @@
+"""The GATT transport interface the VanMoof clients are written against."""
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any, Protocol, runtime_checkable
+
+
+@runtime_checkable
+class GattTransport(Protocol):
+    """
+    A connected GATT link to a bike.
+
+    ``SX3Client``, ``SXClient`` and ``bleak_client_utils`` only use these members,
+    so a ``BleakClient`` satisfies the protocol as-is, and so can an in-memory
+    peripheral used to benchmark the clients without hardware.
+
+    Characteristics are addressed by UUID string or by a characteristic object
+    taken from ``services``.
+    """
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True while the link is up."""
+
+    @property
+    def services(self) -> Any:
+        """Return the GATT table with ``get_service(uuid)`` and per-service ``characteristics``."""
+
+    async def read_gatt_char(self, char_specifier: Any, **kwargs: Any) -> bytearray:
+        """Read a characteristic value."""
+
+    async def write_gatt_char(self, char_specifier: Any, data: bytes, response: bool = False) -> None:
+        """Write a characteristic value."""
+
+    async def start_notify(self, char_specifier: Any, callback: Callable[[Any, bytearray], None], **kwargs: Any) -> None:
+        """Start notifications on a characteristic."""
+
+    async def stop_notify(self, char_specifier: Any) -> None:
+        """Stop notifications on a characteristic."""
+
+    async def disconnect(self) -> bool:
+        """Close the link."""
+
+
+class GattConnector(Protocol):
+    """
+    Open a ``GattTransport`` to a device; ``connect_bleak_client`` is the default.
+
+    ``disconnected_callback`` is called with the transport when the link drops.
+    """
+
+    async def __call__(
+        self,
+        device: Any,
+        disconnected_callback: Callable[[Any], None] | None = None,
+        ble_device_callback: Callable[[], Any] | None = None,
+        max_attempts: int = 3,
+    ) -> GattTransport:
+        ...
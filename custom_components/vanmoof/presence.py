@@ -0,0 +1,231 @@
+"""Passive advertisement-driven presence tracking for VanMoof bikes."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+
+from .const import DATA_SCAN_BROKER, DOMAIN, PRESENCE_CHECK_INTERVAL, PRESENCE_TIMEOUT
+from .transport import async_register_advertisement_callback
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bound for the per-address-and-name route cache; phones rotate random addresses.
+_ROUTE_CACHE_SIZE = 1024
+
+
+class BikeSighting:
+    """Last advertisement seen for a bike."""
+
+    __slots__ = ("device", "rssi", "last_seen")
+
+    def __init__(self, device, rssi: int | None, last_seen: float) -> None:
+        self.device = device
+        self.rssi = rssi
+        self.last_seen = last_seen
+
+
+class VanMoofPresence:
+    """
+    Track a single bike from BLE advertisements without opening a GATT connection.
+
+    Advertisements are delivered by the shared ``VanMoofScanBroker``.
+
+    :param matcher: Callable that returns True when a BLE device is the bike.
+    :param on_change: Called with the new presence whenever it flips.
+    :param is_connected: Optional callable; a connected bike does not advertise,
+        so presence is held while it returns True.
+    """
+
+    def __init__(
+        self,
+        matcher: Callable[[Any], bool],
+        on_change: Callable[[bool], None],
+        is_connected: Callable[[], bool] | None = None,
+    ) -> None:
+        self.matcher = matcher
+        self._on_change = on_change
+        self._is_connected = is_connected
+        self._sighting: BikeSighting | None = None
+        self._present = False
+        self._seen = asyncio.Event()
+
+    @property
+    def present(self) -> bool:
+        """Return True when the bike advertised within the presence timeout."""
+        return self._present
+
+    @property
+    def device(self):
+        """Return the last advertised BLE device for the bike, if present."""
+        if not self._present or self._sighting is None:
+            return None
+        return self._sighting.device
+
+    @property
+    def rssi(self) -> int | None:
+        """Return the RSSI of the last advertisement."""
+        return self._sighting.rssi if self._sighting else None
+
+    @property
+    def last_seen(self) -> float | None:
+        """Return the monotonic timestamp of the last advertisement."""
+        return self._sighting.last_seen if self._sighting else None
+
+    async def async_wait_seen(self, timeout: float) -> bool:
+        """Wait until the bike has been seen at least once, up to ``timeout`` seconds."""
+        if self._seen.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._seen.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    @callback
+    def async_mark_seen(self) -> None:
+        """Refresh the last-seen time, e.g. while a GATT connection suppresses advertising."""
+        if self._sighting is not None:
+            self._sighting.last_seen = time.monotonic()
+
+    @callback
+    def async_on_sighting(self, device, rssi: int | None, now: float) -> None:
+        """Record an advertisement routed to this bike by the scan broker."""
+        if self._sighting is None:
+            self._sighting = BikeSighting(device, rssi, now)
+        else:
+            self._sighting.device = device
+            self._sighting.rssi = rssi
+            self._sighting.last_seen = now
+        self._seen.set()
+
+        if not self._present:
+            _LOGGER.debug(
+                "VanMoof bike %s advertised (RSSI %s); marking as home.",
+                getattr(device, "address", ""),
+                rssi,
+            )
+            self._set_present(True)
+
+    @callback
+    def async_expire(self, now: float) -> None:
+        """Mark the bike away when it stopped advertising."""
+        if not self._present or self._sighting is None:
+            return
+        if self._is_connected is not None and self._is_connected():
+            self._sighting.last_seen = now
+            return
+        if now - self._sighting.last_seen < PRESENCE_TIMEOUT:
+            return
+
+        _LOGGER.debug(
+            "No VanMoof advertisement for %s seconds; marking as not home.",
+            PRESENCE_TIMEOUT,
+        )
+        self._set_present(False)
+
+    def _set_present(self, present: bool) -> None:
+        self._present = present
+        self._on_change(present)
+
+
+class VanMoofScanBroker:
+    """
+    Hold one advertisement subscription on Home Assistant's shared Bluetooth
+    scanners (local adapters and remote proxies) and route matching devices to
+    every subscribed bike, so scan cost stays flat with more bikes.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._hass = hass
+        self._subscribers: list[VanMoofPresence] = []
+        self._routes: dict[tuple[str, str | None], tuple[VanMoofPresence, ...]] = {}
+        self._unsub_advertisements: CALLBACK_TYPE | None = None
+        self._unsub_expire: Callable[[], None] | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_subscribe(self, presence: VanMoofPresence) -> None:
+        """Route advertisements to ``presence``, starting the scan if needed."""
+        async with self._lock:
+            if presence in self._subscribers:
+                return
+            self._subscribers.append(presence)
+            self._routes.clear()
+            if self._unsub_advertisements is None:
+                await self._async_start()
+
+    async def async_unsubscribe(self, presence: VanMoofPresence) -> None:
+        """Stop routing to ``presence``, stopping the scan with the last subscriber."""
+        async with self._lock:
+            if presence not in self._subscribers:
+                return
+            self._subscribers.remove(presence)
+            self._routes.clear()
+            if not self._subscribers:
+                await self._async_stop()
+
+    async def _async_start(self) -> None:
+        self._unsub_advertisements = async_register_advertisement_callback(
+            self._hass, self._async_on_advertisement
+        )
+        self._unsub_expire = async_track_time_interval(
+            self._hass,
+            self._async_expire,
+            timedelta(seconds=PRESENCE_CHECK_INTERVAL),
+        )
+        _LOGGER.debug("Subscribed to Home Assistant Bluetooth advertisements.")
+
+    async def _async_stop(self) -> None:
+        if self._unsub_expire is not None:
+            self._unsub_expire()
+            self._unsub_expire = None
+
+        if self._unsub_advertisements is not None:
+            self._unsub_advertisements()
+            self._unsub_advertisements = None
+        _LOGGER.debug("Unsubscribed from Home Assistant Bluetooth advertisements.")
+
+    def _route(self, device) -> tuple[VanMoofPresence, ...]:
+        # Passive scans often deliver an address before its scan response carries
+        # the local name; key on both so a name-only match is not cached as a miss.
+        key = (getattr(device, "address", ""), getattr(device, "name", None))
+        route = self._routes.get(key)
+        if route is None:
+            if len(self._routes) >= _ROUTE_CACHE_SIZE:
+                self._routes.clear()
+            route = self._routes[key] = tuple(
+                presence for presence in self._subscribers if presence.matcher(device)
+            )
+        return route
+
+    @callback
+    def _async_on_advertisement(self, device, rssi: int | None) -> None:
+        route = self._route(device)
+        if not route:
+            return
+
+        now = time.monotonic()
+        for presence in route:
+            presence.async_on_sighting(device, rssi, now)
+
+    @callback
+    def _async_expire(self, _now=None) -> None:
+        now = time.monotonic()
+        for presence in self._subscribers:
+            presence.async_expire(now)
+
+
+@callback
+def async_get_scan_broker(hass: HomeAssistant) -> VanMoofScanBroker:
+    """Return the scan broker shared by all VanMoof config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    broker = domain_data.get(DATA_SCAN_BROKER)
+    if broker is None:
+        broker = domain_data[DATA_SCAN_BROKER] = VanMoofScanBroker(hass)
+    return broker
@@ -0,0 +1,122 @@
+"""Learned range of a VanMoof bike per power level."""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import (
+    RANGE_KM_PER_PERCENT_LIMITS,
+    RANGE_PRIOR_WEIGHT,
+    RANGE_SMOOTHING,
+)
+from .snapshot import BikeSnapshot
+
+
+def _power_level(value: Any) -> int | None:
+    try:
+        return min(max(int(value), 1), 4)
+    except (TypeError, ValueError):
+        return None
+
+
+class _LevelModel:
+    """Smoothed km per battery percent at one power level."""
+
+    __slots__ = ("km_per_percent", "percent")
+
+    def __init__(self, km_per_percent: float, percent: float) -> None:
+        self.km_per_percent = km_per_percent
+        # Battery percent of riding learned from
+        self.percent = percent
+
+    def add(self, km: float, percent: float) -> None:
+        # Weigh the step by how much battery it covers: a 3% step counts as
+        # three 1% steps of smoothing.
+        smoothing = 1 - (1 - RANGE_SMOOTHING) ** percent
+        self.km_per_percent += smoothing * (km / percent - self.km_per_percent)
+        self.percent += percent
+
+
+class RangeEstimator:
+    """
+    Learn how many km the bike rides per battery percent at each power level.
+
+    Distance is added up between readings until the battery level drops; the
+    km per percent of that stretch then moves the power level's smoothed
+    value. Charging, a power level change or a missing value starts a new
+    stretch. Every reading is O(1) work.
+
+    Estimates blend the learned value with a prior, e.g. the nominal range
+    table, which counts as ``RANGE_PRIOR_WEIGHT`` percent of riding, so the
+    estimate moves from the table to the rider's own range as data comes in.
+    """
+
+    def __init__(self) -> None:
+        self._levels: dict[int, _LevelModel] = {}
+        self._battery: float | None = None
+        self._distance: float | None = None
+        self._power_level: int | None = None
+        self._pending_km = 0.0
+
+    def add(self, data: BikeSnapshot) -> bool:
+        """Learn from a reading; return True when an estimate changed."""
+        battery, distance = data.battery_level, data.distance_travelled
+        power_level = _power_level(data.power_level)
+        previous_battery, previous_distance = self._battery, self._distance
+        self._battery, self._distance = battery, distance
+
+        if (
+            battery is None
+            or distance is None
+            or power_level is None
+            or previous_battery is None
+            or previous_distance is None
+            or power_level != self._power_level
+            or battery > previous_battery
+            or distance < previous_distance
+        ):
+            self._power_level = power_level
+            self._pending_km = 0.0
+            return False
+
+        self._pending_km += distance - previous_distance
+        if battery == previous_battery:
+            return False
+
+        km, percent = self._pending_km, previous_battery - battery
+        self._pending_km = 0.0
+        low, high = RANGE_KM_PER_PERCENT_LIMITS
+        if not low <= km / percent <= high:
+            return False
+
+        model = self._levels.get(power_level)
+        if model is None:
+            self._levels[power_level] = _LevelModel(km / percent, percent)
+        else:
+            model.add(km, percent)
+        return True
+
+    def km_per_percent(self, power_level: Any, prior: float | None = None) -> float | None:
+        """Return the estimated km per battery percent at ``power_level``."""
+        model = self._levels.get(_power_level(power_level))
+        if model is None:
+            return prior
+        if prior is None:
+            return model.km_per_percent
+        return (prior * RANGE_PRIOR_WEIGHT + model.km_per_percent * model.percent) / (
+            RANGE_PRIOR_WEIGHT + model.percent
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the learned values, for storage and diagnostics."""
+        return {
+            str(level): {"km_per_percent": round(model.km_per_percent, 4), "percent": round(model.percent, 1)}
+            for level, model in sorted(self._levels.items())
+        }
+
+    def load(self, data: dict[str, Any]) -> None:
+        """Restore learned values from ``as_dict`` output."""
+        for level, values in data.items():
+            try:
+                self._levels[int(level)] = _LevelModel(float(values["km_per_percent"]), float(values["percent"]))
+            except (KeyError, TypeError, ValueError):
+                continue
@@ -0,0 +1,176 @@
+"""Rolling per-phase timings of VanMoof refreshes."""
+from __future__ import annotations
+
+import time
+from array import array
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from .const import REFRESH_TIMING_WINDOW
+
+# Upper bucket edges in seconds; the last bucket takes everything slower.
+_BUCKET_EDGES = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+PHASES = ("scan", "match", "connect", "resolve", "auth", "read", "reads", "disconnect")
+
+
+def _bucket(seconds: float) -> int:
+    for index, edge in enumerate(_BUCKET_EDGES):
+        if seconds <= edge:
+            return index
+    return len(_BUCKET_EDGES)
+
+
+class PhaseHistogram:
+    """
+    Bucketed durations of the last ``window`` samples of one phase.
+
+    Samples live in a fixed ring of floats; bucket counts are kept up to date as
+    samples enter and leave the window, so percentiles never sort.
+    """
+
+    __slots__ = ("_samples", "_counts", "_next", "_size", "_total", "last")
+
+    def __init__(self, window: int = REFRESH_TIMING_WINDOW) -> None:
+        self._samples = array("d", bytes(8 * window))
+        self._counts = [0] * (len(_BUCKET_EDGES) + 1)
+        self._next = 0
+        self._size = 0
+        self._total = 0.0
+        self.last: float | None = None
+
+    @property
+    def count(self) -> int:
+        """Return the number of samples in the window."""
+        return self._size
+
+    def add(self, seconds: float) -> None:
+        """Add a sample, dropping the oldest once the window is full."""
+        if self._size == len(self._samples):
+            oldest = self._samples[self._next]
+            self._counts[_bucket(oldest)] -= 1
+            self._total -= oldest
+        else:
+            self._size += 1
+        self._samples[self._next] = seconds
+        self._next = (self._next + 1) % len(self._samples)
+        self._counts[_bucket(seconds)] += 1
+        self._total += seconds
+        self.last = seconds
+
+    def mean(self) -> float | None:
+        """Return the mean of the window."""
+        return self._total / self._size if self._size else None
+
+    def percentile(self, percent: float) -> float | None:
+        """
+        Return the upper bucket edge holding the given percentile, or the slowest
+        sample when it falls beyond the last edge.
+        """
+        if not self._size:
+            return None
+        rank = percent / 100 * self._size
+        seen = 0
+        for index, count in enumerate(self._counts[:-1]):
+            seen += count
+            if count and seen >= rank:
+                return _BUCKET_EDGES[index]
+        return round(max(self._samples[:self._size]), 3)
+
+    def as_dict(self) -> dict[str, Any]:
+        mean = self.mean()
+        return {
+            "count": self._size,
+            "last": round(self.last, 3) if self.last is not None else None,
+            "mean": round(mean, 3) if mean is not None else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "buckets": {
+                f"<={edge}s" if index < len(_BUCKET_EDGES) else f">{_BUCKET_EDGES[-1]}s": count
+                for index, (edge, count) in enumerate(zip((*_BUCKET_EDGES, None), self._counts))
+                if count
+            },
+        }
+
+
+class RefreshTimings:
+    """
+    Timings of one bike's refreshes: a histogram per phase, the duration of the
+    last refresh and the success rate over the last ``window`` refreshes.
+    """
+
+    def __init__(self, window: int = REFRESH_TIMING_WINDOW) -> None:
+        self._window = window
+        self._phases: dict[str, PhaseHistogram] = {}
+        self._refreshes = PhaseHistogram(window)
+        self._outcomes = bytearray()
+        self._current: dict[str, list] = {}
+
+    def begin_refresh(self) -> None:
+        """Start collecting the phases of a new refresh for ``summary``."""
+        self._current.clear()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one sample of ``name``."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, time.monotonic() - started)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Add a sample of ``name``."""
+        histogram = self._phases.get(name)
+        if histogram is None:
+            histogram = self._phases[name] = PhaseHistogram(self._window)
+        histogram.add(seconds)
+        current = self._current.setdefault(name, [0.0, 0])
+        current[0] += seconds
+        current[1] += 1
+
+    def record_refresh(self, seconds: float, success: bool) -> None:
+        """Record how long a whole refresh took and whether it reached the bike."""
+        self._refreshes.add(seconds)
+        self._outcomes.append(success)
+        if len(self._outcomes) > self._window:
+            del self._outcomes[0]
+
+    def last(self, name: str) -> float | None:
+        """Return the last sample of a phase."""
+        histogram = self._phases.get(name)
+        return histogram.last if histogram else None
+
+    @property
+    def last_refresh(self) -> float | None:
+        """Return the duration of the last refresh in seconds."""
+        return self._refreshes.last
+
+    @property
+    def success_rate(self) -> float | None:
+        """Return the share of recent refreshes that reached the bike, in percent."""
+        if not self._outcomes:
+            return None
+        return round(100 * sum(self._outcomes) / len(self._outcomes), 1)
+
+    def summary(self) -> str:
+        """Return the time spent in each phase of the current refresh, for logging."""
+        parts = []
+        for name in PHASES:
+            if name not in self._current:
+                continue
+            total, count = self._current[name]
+            if count == 1:
+                parts.append(f"{name} {total:.3f}s")
+            else:
+                parts.append(f"{name} {count}x {total / count:.3f}s")
+        return ", ".join(parts)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timings for diagnostics."""
+        return {
+            "refresh": self._refreshes.as_dict(),
+            "success_rate": self.success_rate,
+            "phases": {name: self._phases[name].as_dict() for name in PHASES if name in self._phases},
+        }
@@ -0,0 +1,70 @@
+"""Adaptive polling interval selection for VanMoof bikes."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+from .const import IDLE_BACKOFF_FACTOR, MAX_POLLING_INTERVAL, MIN_POLLING_INTERVAL
+from .snapshot import ABSENT, BikeSnapshot
+
+
+class AdaptivePollingScheduler:
+    """
+    Pick the next polling interval from the latest bike state.
+
+    - Riding or waiting to unlock: poll at ``MIN_POLLING_INTERVAL``.
+    - Charging: poll as often as the charge curve fit asks for, between
+      ``MIN_POLLING_INTERVAL`` and the configured interval.
+    - Locked and idle: back off from the configured interval towards
+      ``MAX_POLLING_INTERVAL``, growing with every idle poll.
+    - Absent, i.e. not advertising: poll at ``MAX_POLLING_INTERVAL``; the
+      presence tracker requests a refresh as soon as the bike advertises again.
+    - Anything else: the configured interval.
+
+    :param base_interval: The configured polling interval in seconds.
+    :param enabled: When False the configured interval is always used.
+    """
+
+    def __init__(self, base_interval: float, enabled: bool = True) -> None:
+        self._base_interval = base_interval
+        self._enabled = enabled
+        self._idle_polls = 0
+
+    def next_interval(self, data: BikeSnapshot | None, charge_interval: float | None = None) -> timedelta:
+        """
+        Return the interval until the next poll given the latest data and, during
+        a charge session, the seconds the charge tracker asks for.
+        """
+        return timedelta(seconds=self._next_seconds(data or ABSENT, charge_interval))
+
+    def _next_seconds(self, data: BikeSnapshot, charge_interval: float | None) -> float:
+        if not self._enabled:
+            return self._base_interval
+
+        if not data.present:
+            self._idle_polls = 0
+            return max(self._base_interval, MAX_POLLING_INTERVAL)
+
+        if self._is_active(data):
+            self._idle_polls = 0
+            return min(self._base_interval, MIN_POLLING_INTERVAL)
+
+        if charge_interval is not None:
+            self._idle_polls = 0
+            return min(max(charge_interval, MIN_POLLING_INTERVAL), self._base_interval)
+
+        if data.lock_state == "LOCKED":
+            self._idle_polls += 1
+            return min(
+                self._base_interval * IDLE_BACKOFF_FACTOR ** self._idle_polls,
+                max(self._base_interval, MAX_POLLING_INTERVAL),
+            )
+
+        self._idle_polls = 0
+        return self._base_interval
+
+    @staticmethod
+    def _is_active(data: BikeSnapshot) -> bool:
+        return (
+            (data.speed or 0) > 0
+            or data.lock_state == "AWAITING_UNLOCK"
+        )
@@ -1,11 +1,12 @@
 import logging
 from homeassistant.components.sensor import SensorEntity, SensorDeviceClass
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 
 from .const import DOMAIN
-from .vanmoof_coordinator import VanMoofDataUpdateCoordinator
+from .snapshot import ABSENT, BikeSnapshot
+from .vanmoof_coordinator import CHARGE_SESSION_FIELD, VanMoofDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,13 +30,63 @@ async def async_setup_entry(hass: HomeAssistant, config_entry, async_add_entitie
             VanMoofLightModeSensor(coordinator, config_entry, mac_address),
             VanMoofModuleStateSensor(coordinator, config_entry, mac_address),
             VanMoofErrorCodeSensor(coordinator, config_entry, mac_address),
+            VanMoofConsumptionSensor(coordinator, config_entry, mac_address),
+            VanMoofChargeRateSensor(coordinator, config_entry, mac_address),
+            VanMoofChargeTimeToFullSensor(coordinator, config_entry, mac_address),
+            VanMoofChargeTimeToTargetSensor(coordinator, config_entry, mac_address),
+            VanMoofChargeEnergySensor(coordinator, config_entry, mac_address),
+            VanMoofConnectionQueueSensor(coordinator, config_entry, mac_address),
+            VanMoofLastRefreshDurationSensor(coordinator, config_entry, mac_address),
+            VanMoofConnectTimeSensor(coordinator, config_entry, mac_address),
+            VanMoofRefreshSuccessRateSensor(coordinator, config_entry, mac_address),
         ]
     )
 
 
+def _bike_generation(config_entry) -> str:
+    """Return the S1, S2 or S3 generation of the configured bike."""
+    bike_model = str(config_entry.data.get("bike_model", "")).upper()
+    vanmoof_type = str(config_entry.data.get("vanmoof_type", "")).upper()
+    bike_name = str(config_entry.data.get("bike_name", "")).upper()
+    model_value = f"{bike_model} {vanmoof_type} {bike_name}"
+
+    if (
+        "S3" in model_value
+        or "X3" in model_value
+        or "SX3" in model_value
+        or "ES-3" in model_value
+        or "2020" in model_value
+        or "ELECTRIFIED_2020" in model_value
+    ):
+        return "S3"
+    if (
+        "S2" in model_value
+        or "X2" in model_value
+        or "ES-2" in model_value
+        or "2018" in model_value
+        or "ELECTRIFIED_2018" in model_value
+    ):
+        return "S2"
+    if (
+        "S1" in model_value
+        or "X1" in model_value
+        or "ES-1" in model_value
+        or "2016" in model_value
+        or "2017" in model_value
+        or "SMARTBIKE" in model_value
+        or "ELECTRIFIED_2016" in model_value
+        or "ELECTRIFIED_2017" in model_value
+    ):
+        return "S1"
+    return "S1"
+
+
 class VanMoofSensor(CoordinatorEntity, SensorEntity):
     """Base VanMoof sensor entity."""
 
+    # Coordinator data fields the state is built from; None writes state on every update
+    _fields: tuple[str, ...] | None = None
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str, name: str, unique_id: str):
         super().__init__(coordinator)
         self._config_entry = config_entry
@@ -55,11 +106,21 @@ class VanMoofSensor(CoordinatorEntity, SensorEntity):
     def available(self):
         return True
 
-    def _data(self):
-        return self.coordinator.data or {}
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when a field this sensor depends on changed."""
+        if self.coordinator.fields_changed(self._fields):
+            super()._handle_coordinator_update()
 
-    def _value(self, key):
-        return self._data().get(key)
+    @property
+    def extra_state_attributes(self):
+        """Mark readings carried over from before the bike went out of reach."""
+        if self._fields is None or not self.coordinator.stale:
+            return None
+        return {"stale": True, "last_reading": self.coordinator.last_reading.isoformat()}
+
+    def _data(self) -> BikeSnapshot:
+        return self.coordinator.data or ABSENT
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -76,12 +137,14 @@ class VanMoofSensor(CoordinatorEntity, SensorEntity):
 class VanMoofBatterySensor(VanMoofSensor):
     """VanMoof battery level sensor."""
 
+    _fields = ("battery_level",)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Battery Level", f"vanmoof_bike_{mac_address}_battery")
 
     @property
     def state(self):
-        return self._value("battery_level")
+        return self._data().battery_level
 
     @property
     def device_class(self):
@@ -95,12 +158,14 @@ class VanMoofBatterySensor(VanMoofSensor):
 class VanMoofModuleLevelSensor(VanMoofSensor):
     """VanMoof module level sensor."""
 
+    _fields = ("module_level",)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Module Level", f"vanmoof_bike_{mac_address}_module_level")
 
     @property
     def state(self):
-        return self._value("module_level")
+        return self._data().module_level
 
     @property
     def device_class(self):
@@ -112,7 +177,15 @@ class VanMoofModuleLevelSensor(VanMoofSensor):
 
 
 class VanMoofEstimatedRangeSensor(VanMoofSensor):
-    """VanMoof estimated range sensor."""
+    """
+    VanMoof estimated range sensor.
+
+    The nominal full-battery range below is the starting point; the
+    coordinator's range estimator moves it towards the km per battery percent
+    this bike actually rides at each power level.
+    """
+
+    _fields = ("battery_level", "power_level", "region")
 
     FULL_BATTERY_RANGE_KM = {
         "S1": {
@@ -134,62 +207,29 @@ class VanMoofEstimatedRangeSensor(VanMoofSensor):
 
     @property
     def state(self):
-        battery_level = self._to_int(self._value("battery_level"))
-        power_level = self._to_int(self._value("power_level"))
+        battery_level = self._to_int(self._data().battery_level)
+        power_level = self._to_int(self._data().power_level)
         if battery_level is None or power_level is None:
             return None
 
-        model = self._range_model()
+        model = _bike_generation(self._config_entry)
         region = self._range_region()
         power_level = min(max(power_level, 1), 4)
         full_range = self.FULL_BATTERY_RANGE_KM.get(model, {}).get(region, {}).get(power_level)
-        if full_range is None:
+        km_per_percent = self.coordinator.range_estimator.km_per_percent(
+            power_level, full_range / 100 if full_range is not None else None
+        )
+        if km_per_percent is None:
             return None
 
-        return round(full_range * battery_level / 100)
+        return round(km_per_percent * battery_level)
 
     @property
     def unit_of_measurement(self):
         return "km"
 
-    def _range_model(self) -> str | None:
-        bike_model = str(self._config_entry.data.get("bike_model", "")).upper()
-        vanmoof_type = str(self._config_entry.data.get("vanmoof_type", "")).upper()
-        bike_name = str(self._config_entry.data.get("bike_name", "")).upper()
-        model_value = f"{bike_model} {vanmoof_type} {bike_name}"
-
-        if (
-            "S3" in model_value
-            or "X3" in model_value
-            or "SX3" in model_value
-            or "ES-3" in model_value
-            or "2020" in model_value
-            or "ELECTRIFIED_2020" in model_value
-        ):
-            return "S3"
-        if (
-            "S2" in model_value
-            or "X2" in model_value
-            or "ES-2" in model_value
-            or "2018" in model_value
-            or "ELECTRIFIED_2018" in model_value
-        ):
-            return "S2"
-        if (
-            "S1" in model_value
-            or "X1" in model_value
-            or "ES-1" in model_value
-            or "2016" in model_value
-            or "2017" in model_value
-            or "SMARTBIKE" in model_value
-            or "ELECTRIFIED_2016" in model_value
-            or "ELECTRIFIED_2017" in model_value
-        ):
-            return "S1"
-        return "S1"
-
     def _range_region(self) -> str | None:
-        region = self._value("region")
+        region = self._data().region
         if region is None:
             return "EU"
 
@@ -213,25 +253,29 @@ class VanMoofLockStateSensor(VanMoofSensor):
 
     """VanMoof lock state sensor."""
 
+    _fields = ("lock_state",)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Lock State", f"vanmoof_bike_{mac_address}_lock_state")
 
     @property
     def state(self):
-        return self._value("lock_state")
+        return self._data().lock_state
 
 
 class VanMoofEvccStatusSensor(VanMoofSensor):
     """VanMoof EVCC status helper sensor."""
 
+    _fields = ("present", "charging", "battery_level", CHARGE_SESSION_FIELD)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike EVCC Status", f"vanmoof_bike_{mac_address}_evcc_status")
 
     @property
     def state(self):
-        if not self._data().get("present"):
+        if not self._data().present:
             return "a"
-        if self._value("charging") == "CHARGING":
+        if self._data().charging == "CHARGING" or self.coordinator.charge_sessions.charging:
             return "c"
         return "b"
 
@@ -239,12 +283,14 @@ class VanMoofEvccStatusSensor(VanMoofSensor):
 class VanMoofDistanceSensor(VanMoofSensor):
     """VanMoof distance travelled sensor."""
 
+    _fields = ("distance_travelled",)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Distance", f"vanmoof_bike_{mac_address}_distance")
 
     @property
     def state(self):
-        return self._value("distance_travelled")
+        return self._data().distance_travelled
 
     @property
     def unit_of_measurement(self):
@@ -254,61 +300,73 @@ class VanMoofDistanceSensor(VanMoofSensor):
 class VanMoofPowerLevelSensor(VanMoofSensor):
     """VanMoof power level sensor."""
 
+    _fields = ("power_level",)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Power Level", f"vanmoof_bike_{mac_address}_power_level")
 
     @property
     def state(self):
-        return self._value("power_level")
+        return self._data().power_level
 
 
 class VanMoofRegionSensor(VanMoofSensor):
     """VanMoof bike region sensor."""
 
+    _fields = ("region",)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Region", f"vanmoof_bike_{mac_address}_region")
 
     @property
     def state(self):
-        return self._value("region")
+        return self._data().region
 
 
 class VanMoofLightModeSensor(VanMoofSensor):
     """VanMoof light mode sensor."""
 
+    _fields = ("light_mode",)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Light Mode", f"vanmoof_bike_{mac_address}_light_mode")
 
     @property
     def state(self):
-        return self._value("light_mode")
+        return self._data().light_mode
 
 
 class VanMoofModuleStateSensor(VanMoofSensor):
     """VanMoof module state sensor."""
 
+    _fields = ("module_state",)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Module State", f"vanmoof_bike_{mac_address}_module_state")
 
     @property
     def state(self):
-        return self._value("module_state")
+        return self._data().module_state
 
 
 class VanMoofChargingSensor(VanMoofSensor):
     """VanMoof charging state sensor."""
 
+    _fields = ("charging",)
+
     def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
         super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Charging", f"vanmoof_bike_{mac_address}_charging")
 
     @property
     def state(self):
-        return self._value("charging")
+        return self._data().charging
 
 
 class VanMoofErrorCodeSensor(VanMoofSensor):
     """VanMoof error code sensor."""
 
+    _fields = ("errors",)
+
     ERROR_MESSAGES = {
         0: "No Error",
         1: "Motor Stalled",
@@ -332,8 +390,200 @@ class VanMoofErrorCodeSensor(VanMoofSensor):
 
     @property
     def state(self):
-        errors = self._value("errors")
+        errors = self._data().errors
         if isinstance(errors, int):
             message = self.ERROR_MESSAGES.get(errors, "Unknown Error")
             return f"{message} ({errors})"
         return errors or "Unknown Error"
+
+
+class VanMoofConsumptionSensor(VanMoofSensor):
+    """Battery percent used per km, from the telemetry history."""
+
+    _fields = ("battery_level", "distance_travelled")
+
+    def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
+        super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Consumption", f"vanmoof_bike_{mac_address}_consumption")
+
+    @property
+    def state(self):
+        consumption = self.coordinator.telemetry.consumption()
+        return round(consumption, 2) if consumption is not None else None
+
+    @property
+    def unit_of_measurement(self):
+        return "%/km"
+
+
+class VanMoofChargeRateSensor(VanMoofSensor):
+    """Battery percent gained per hour, from the telemetry history."""
+
+    _fields = ("battery_level",)
+
+    def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
+        super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Charge Rate", f"vanmoof_bike_{mac_address}_charge_rate")
+
+    @property
+    def state(self):
+        rate = self.coordinator.telemetry.charge_rate()
+        return round(rate, 1) if rate is not None else None
+
+    @property
+    def unit_of_measurement(self):
+        return "%/h"
+
+
+class VanMoofChargeTimeToFullSensor(VanMoofSensor):
+    """Minutes until the battery is full, from the fitted charge curve."""
+
+    _fields = ("battery_level", "charging", CHARGE_SESSION_FIELD)
+
+    def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
+        super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Time To Full", f"vanmoof_bike_{mac_address}_time_to_full")
+
+    @property
+    def state(self):
+        session = self.coordinator.charge_sessions.session
+        seconds = session.seconds_to(100) if session is not None else None
+        return round(seconds / 60) if seconds is not None else None
+
+    @property
+    def device_class(self):
+        return SensorDeviceClass.DURATION
+
+    @property
+    def unit_of_measurement(self):
+        return "min"
+
+
+class VanMoofChargeTimeToTargetSensor(VanMoofSensor):
+    """Minutes until the battery reaches the configured charge target."""
+
+    _fields = ("battery_level", "charging", CHARGE_SESSION_FIELD)
+
+    def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
+        super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Time To Target", f"vanmoof_bike_{mac_address}_time_to_target")
+
+    @property
+    def state(self):
+        session = self.coordinator.charge_sessions.session
+        seconds = session.seconds_to(self.coordinator.charge_target) if session is not None else None
+        return round(seconds / 60) if seconds is not None else None
+
+    @property
+    def extra_state_attributes(self):
+        return {**(super().extra_state_attributes or {}), "target": self.coordinator.charge_target}
+
+    @property
+    def device_class(self):
+        return SensorDeviceClass.DURATION
+
+    @property
+    def unit_of_measurement(self):
+        return "min"
+
+
+class VanMoofChargeEnergySensor(VanMoofSensor):
+    """Energy delivered to the battery in the current or last charge session."""
+
+    _fields = ("battery_level", "charging", CHARGE_SESSION_FIELD)
+
+    # Nominal battery capacity per generation in Wh
+    BATTERY_CAPACITY_WH = {"S1": 418, "S2": 504, "S3": 504}
+
+    def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
+        super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Charge Energy", f"vanmoof_bike_{mac_address}_charge_energy")
+
+    @property
+    def state(self):
+        session = self.coordinator.charge_sessions.session
+        if session is None:
+            return None
+        capacity = self.BATTERY_CAPACITY_WH[_bike_generation(self._config_entry)]
+        return round(session.percent_delivered * capacity / 100)
+
+    @property
+    def device_class(self):
+        return SensorDeviceClass.ENERGY
+
+    @property
+    def unit_of_measurement(self):
+        return "Wh"
+
+
+class VanMoofConnectionQueueSensor(VanMoofSensor):
+    """Connections waiting for a free Bluetooth adapter or proxy slot."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
+        super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Connection Queue", f"vanmoof_bike_{mac_address}_connection_queue")
+
+    @property
+    def state(self):
+        return self.coordinator.connection_queue_depth
+
+
+class VanMoofLastRefreshDurationSensor(VanMoofSensor):
+    """Duration of the last refresh that tried to reach the bike."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
+        super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Last Refresh Duration", f"vanmoof_bike_{mac_address}_last_refresh_duration")
+
+    @property
+    def state(self):
+        duration = self.coordinator.refresh_timings.last_refresh
+        return round(duration, 2) if duration is not None else None
+
+    @property
+    def device_class(self):
+        return SensorDeviceClass.DURATION
+
+    @property
+    def unit_of_measurement(self):
+        return "s"
+
+
+class VanMoofConnectTimeSensor(VanMoofSensor):
+    """Time taken by the last Bluetooth connection attempt."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
+        super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Connect Time", f"vanmoof_bike_{mac_address}_connect_time")
+
+    @property
+    def state(self):
+        duration = self.coordinator.refresh_timings.last("connect")
+        return round(duration, 2) if duration is not None else None
+
+    @property
+    def device_class(self):
+        return SensorDeviceClass.DURATION
+
+    @property
+    def unit_of_measurement(self):
+        return "s"
+
+
+class VanMoofRefreshSuccessRateSensor(VanMoofSensor):
+    """Share of recent refreshes that reached the bike."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: VanMoofDataUpdateCoordinator, config_entry, mac_address: str):
+        super().__init__(coordinator, config_entry, mac_address, "VanMoof Bike Refresh Success Rate", f"vanmoof_bike_{mac_address}_refresh_success_rate")
+
+    @property
+    def state(self):
+        return self.coordinator.refresh_timings.success_rate
+
+    @property
+    def unit_of_measurement(self):
+        return "%"
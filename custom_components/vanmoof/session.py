@@ -0,0 +1,221 @@
+"""Persistent GATT session handling for VanMoof bikes."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import UpdateFailed
+
+from .bleak_client_utils import (
+    connect_bleak_client,
+    disconnect_bleak_client,
+    prime_characteristic_cache,
+)
+from .connection_arbiter import ConnectionArbiter, adapter_for_device
+from .const import CONNECTION_SLOT_TIMEOUT, DEFAULT_CONNECT_ATTEMPTS
+from .gatt_transport import GattConnector, GattTransport
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ConnectionSlotTimeout(UpdateFailed):
+    """No connection slot on the adapter became free in time; the bike may be fine."""
+
+
+class VanMoofSession:
+    """
+    Keep a GATT connection to a bike open between polls.
+
+    The connection is closed after ``idle_timeout`` seconds without use. With an
+    idle timeout of 0 the link is closed as soon as it is released, which matches
+    a connect/disconnect per poll.
+
+    A connection slot on the adapter carrying the link is held from connect
+    until disconnect. An idle link is closed early when another bike waits for
+    a slot on the same adapter.
+
+    :param hass: The Home Assistant instance.
+    :param idle_timeout: Seconds to keep an unused connection open.
+    :param arbiter: The connection arbiter shared by all bikes.
+    :param connector: Opens the GATT link; ``connect_bleak_client`` by default.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        idle_timeout: float,
+        arbiter: ConnectionArbiter,
+        connector: GattConnector = connect_bleak_client,
+    ) -> None:
+        self._hass = hass
+        self._idle_timeout = idle_timeout
+        self._arbiter = arbiter
+        self._connector = connector
+        self._slot_adapter: str | None = None
+        self._client: GattTransport | None = None
+        self._services_resolved = False
+        self._bike_client: Any = None
+        self._in_use = 0
+        self._idle_handle: asyncio.TimerHandle | None = None
+        self._unregister_idle: Callable[[], None] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Return True when connections are kept open between polls."""
+        return self._idle_timeout > 0
+
+    @property
+    def is_connected(self) -> bool:
+        """Return True while the GATT link is up."""
+        return self._client is not None and self._client.is_connected
+
+    @property
+    def services_resolved(self) -> bool:
+        """Return True once the characteristics of the current link are cached."""
+        return self._services_resolved
+
+    @property
+    def bike_client(self) -> Any:
+        """Return the authenticated SX/SX3 client for the current link, if any."""
+        return self._bike_client
+
+    @bike_client.setter
+    def bike_client(self, bike_client: Any) -> None:
+        self._bike_client = bike_client
+
+    async def async_connect(
+        self,
+        device,
+        ble_device_callback: Callable[[], Any] | None = None,
+        max_attempts: int = DEFAULT_CONNECT_ATTEMPTS,
+    ) -> GattTransport:
+        """Return a connected client, reusing the open link when there is one."""
+        self._cancel_idle_timer()
+        self._in_use += 1
+
+        if self.is_connected:
+            return self._client
+
+        try:
+            await self._async_acquire_slot(device)
+            self._bike_client = None
+            self._services_resolved = False
+            self._client = await self._connector(
+                device,
+                disconnected_callback=self._on_disconnect,
+                ble_device_callback=ble_device_callback,
+                max_attempts=max_attempts,
+            )
+        except BaseException:
+            self._in_use -= 1
+            self._release_slot()
+            raise
+        return self._client
+
+    async def async_resolve_services(self) -> None:
+        """Resolve and cache the characteristics of a new link once."""
+        if self._services_resolved or self._client is None:
+            return
+        await prime_characteristic_cache(self._client)
+        self._services_resolved = True
+
+    async def async_release(self) -> None:
+        """Release the link after a poll; close it now or after the idle timeout."""
+        self._in_use = max(self._in_use - 1, 0)
+        if self._in_use:
+            return
+
+        if (
+            not self.enabled
+            or self._slot_adapter is None
+            or self._arbiter.queue_depth(self._slot_adapter)
+        ):
+            await self.async_close()
+            return
+
+        self._cancel_idle_timer()
+        self._idle_handle = self._hass.loop.call_later(
+            self._idle_timeout, self._async_idle_expired
+        )
+        self._unregister_idle = self._arbiter.async_register_idle(
+            self._slot_adapter, self._async_slot_wanted
+        )
+
+    async def async_close(self) -> None:
+        """Disconnect and forget the current link."""
+        self._cancel_idle_timer()
+        self._in_use = 0
+        client, self._client = self._client, None
+        bike_client, self._bike_client = self._bike_client, None
+        if client is not None:
+            # Stop S3/X3 notifications so the bike does not keep pushing to a closed session.
+            unsubscribe = getattr(bike_client, "unsubscribe", None)
+            if unsubscribe is not None and client.is_connected:
+                await unsubscribe()
+            try:
+                await disconnect_bleak_client(client)
+            except Exception:
+                pass
+        self._release_slot()
+
+    async def _async_acquire_slot(self, device) -> None:
+        if self._slot_adapter is not None:
+            return
+        adapter = adapter_for_device(device)
+        try:
+            await asyncio.wait_for(
+                self._arbiter.async_acquire(adapter),
+                CONNECTION_SLOT_TIMEOUT,
+            )
+        except asyncio.TimeoutError as err:
+            raise ConnectionSlotTimeout(
+                f"No connection slot on {adapter} became free within {CONNECTION_SLOT_TIMEOUT} seconds"
+            ) from err
+        self._slot_adapter = adapter
+
+    def _release_slot(self) -> None:
+        adapter, self._slot_adapter = self._slot_adapter, None
+        if adapter is not None:
+            self._arbiter.release(adapter)
+
+    @callback
+    def _async_idle_expired(self) -> None:
+        self._idle_handle = None
+        if self._in_use:
+            return
+        _LOGGER.debug("VanMoof GATT session idle for %s seconds; disconnecting.", self._idle_timeout)
+        self._hass.async_create_task(self._async_close_idle())
+
+    async def _async_close_idle(self) -> None:
+        # A poll may have picked the link up again before this task ran.
+        if not self._in_use:
+            await self.async_close()
+
+    @callback
+    def _async_slot_wanted(self) -> None:
+        if self._in_use or self._idle_handle is None:
+            return
+        _LOGGER.debug("Another VanMoof bike waits for %s; closing the idle session.", self._slot_adapter)
+        self._cancel_idle_timer()
+        self._hass.async_create_task(self._async_close_idle())
+
+    def _cancel_idle_timer(self) -> None:
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        if self._unregister_idle is not None:
+            self._unregister_idle()
+            self._unregister_idle = None
+
+    def _on_disconnect(self, client: GattTransport) -> None:
+        """Drop the authenticated client so the next poll authenticates again."""
+        if client is not self._client:
+            return
+        _LOGGER.debug("VanMoof bike disconnected; session will re-authenticate.")
+        self._bike_client = None
+        self._client = None
+        self._cancel_idle_timer()
+        self._release_slot()
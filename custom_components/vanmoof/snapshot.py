@@ -0,0 +1,61 @@
+"""Immutable snapshot of a VanMoof bike's state."""
+from __future__ import annotations
+
+from dataclasses import dataclass, fields, replace
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class BikeSnapshot:
+    """
+    One reading of a bike, with the same fields for every bike generation.
+
+    Values a bike does not report stay ``None``. Snapshots never change once
+    built; use ``replace`` to derive an updated one.
+    """
+
+    available: bool = False
+    present: bool = False
+    battery_level: int | None = None
+    module_level: int | None = None
+    lock_state: str | None = None
+    distance_travelled: float | None = None
+    power_level: int | None = None
+    region: str | None = None
+    light_mode: int | str | None = None
+    module_state: int | str | None = None
+    charging: str | None = None
+    errors: int | None = None
+    speed: int | None = None
+    motor_battery_state: int | None = None
+    module_battery_state: int | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BikeSnapshot:
+        """Build a snapshot from ``as_dict`` output, ignoring unknown fields."""
+        return cls(**{name: value for name, value in data.items() if name in FIELD_NAMES})
+
+    def replace(self, **changes: Any) -> BikeSnapshot:
+        """Return a copy with ``changes`` applied."""
+        return replace(self, **changes)
+
+    def changed_fields(self, other: BikeSnapshot | None) -> frozenset[str]:
+        """Return the names of the fields that differ from ``other``."""
+        if other is None:
+            return FIELD_NAMES
+        if other is self:
+            return frozenset()
+        return frozenset(
+            name for name in _FIELD_NAMES if getattr(self, name) != getattr(other, name)
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the fields as a dict, e.g. for diagnostics."""
+        return {name: getattr(self, name) for name in _FIELD_NAMES}
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(BikeSnapshot))
+FIELD_NAMES = frozenset(_FIELD_NAMES)
+
+# Shared snapshot of a bike that is out of reach
+ABSENT = BikeSnapshot()
@@ -0,0 +1,131 @@
+"""Last known snapshot and learned models of every VanMoof bike, persisted across restarts."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DATA_SNAPSHOT_STORE, DOMAIN, SNAPSHOT_SAVE_DELAY
+from .snapshot import BikeSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.snapshots"
+
+
+@dataclass(frozen=True, slots=True)
+class StoredSnapshot:
+    """The last reading of a bike and when it was taken."""
+
+    snapshot: BikeSnapshot
+    updated: datetime
+
+
+class SnapshotStore:
+    """
+    The latest reading and the learned models of each config entry.
+
+    Coordinators record every reading they publish and restore the last one on
+    startup, so entities have values before the bike is first reached. Models,
+    such as the range estimator, are kept as plain dicts by name. Both are
+    written to ``.storage`` at most every ``SNAPSHOT_SAVE_DELAY`` seconds and
+    once more when Home Assistant stops.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self._store: Store[dict[str, Any]] = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._snapshots: dict[str, StoredSnapshot] = {}
+        self._models: dict[str, dict[str, Any]] = {}
+        self._load_lock = asyncio.Lock()
+        self._loaded = False
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the stored readings once; later calls return immediately."""
+        if self._loaded:
+            return
+        async with self._load_lock:
+            if self._loaded:
+                return
+            stored = await self._store.async_load() or {}
+            for entry_id, entry in stored.get("entries", {}).items():
+                updated = dt_util.parse_datetime(entry.get("updated") or "")
+                if updated is None:
+                    continue
+                try:
+                    snapshot = BikeSnapshot.from_dict(entry.get("snapshot") or {})
+                except (TypeError, ValueError) as err:
+                    _LOGGER.debug("Ignoring the stored VanMoof state of %s: %s", entry_id, err)
+                    continue
+                self._snapshots.setdefault(entry_id, StoredSnapshot(snapshot, updated))
+            for entry_id, models in stored.get("models", {}).items():
+                self._models.setdefault(entry_id, {}).update(models)
+            self._loaded = True
+
+    def get(self, entry_id: str) -> StoredSnapshot | None:
+        """Return the last reading of a config entry."""
+        return self._snapshots.get(entry_id)
+
+    @callback
+    def async_set(self, entry_id: str, snapshot: BikeSnapshot) -> StoredSnapshot:
+        """Remember the latest reading of a config entry and schedule a save."""
+        stored = self._snapshots[entry_id] = StoredSnapshot(snapshot, dt_util.utcnow())
+        self._async_schedule_save()
+        return stored
+
+    def get_model(self, entry_id: str, name: str) -> dict[str, Any] | None:
+        """Return a stored model of a config entry."""
+        return self._models.get(entry_id, {}).get(name)
+
+    @callback
+    def async_set_model(self, entry_id: str, name: str, data: dict[str, Any]) -> None:
+        """Remember a model of a config entry and schedule a save."""
+        self._models.setdefault(entry_id, {})[name] = data
+        self._async_schedule_save()
+
+    @callback
+    def async_remove(self, entry_id: str) -> None:
+        """Forget a config entry and schedule a save."""
+        snapshot = self._snapshots.pop(entry_id, None)
+        models = self._models.pop(entry_id, None)
+        if snapshot is not None or models is not None:
+            self._async_schedule_save()
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        # Store.async_delay_save restarts its timer on every call; with bikes polled
+        # more often than the delay, saves would wait for shutdown.
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        self._save_pending = False
+        return {
+            "entries": {
+                entry_id: {
+                    "updated": stored.updated.isoformat(),
+                    "snapshot": stored.snapshot.as_dict(),
+                }
+                for entry_id, stored in self._snapshots.items()
+            },
+            "models": self._models,
+        }
+
+
+@callback
+def async_get_snapshot_store(hass: HomeAssistant) -> SnapshotStore:
+    """Return the snapshot store shared by all VanMoof config entries."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    store = domain_data.get(DATA_SNAPSHOT_STORE)
+    if store is None:
+        store = domain_data[DATA_SNAPSHOT_STORE] = SnapshotStore(hass)
+    return store
@@ -0,0 +1,96 @@
+"""Rolling scores for the adapters and proxies that can reach a bike."""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import (
+    SOURCE_FAILURE_PENALTY,
+    SOURCE_LATENCY_PENALTY,
+    SOURCE_SCORE_SMOOTHING,
+)
+
+
+class SourceScore:
+    """Smoothed RSSI, connect time and failure rate of one adapter or proxy."""
+
+    __slots__ = ("rssi", "connect_time", "failure_rate", "attempts")
+
+    def __init__(self) -> None:
+        self.rssi: float | None = None
+        self.connect_time: float | None = None
+        self.failure_rate = 0.0
+        self.attempts = 0
+
+    def score(self, rssi: int | None = None) -> float:
+        """Return the score in dBm-like units; higher is better."""
+        signal = self.rssi if self.rssi is not None else rssi
+        if signal is None:
+            signal = -100.0
+        return (
+            signal
+            - SOURCE_FAILURE_PENALTY * self.failure_rate
+            - SOURCE_LATENCY_PENALTY * (self.connect_time or 0.0)
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "rssi": round(self.rssi, 1) if self.rssi is not None else None,
+            "connect_time": round(self.connect_time, 2) if self.connect_time is not None else None,
+            "failure_rate": round(self.failure_rate, 3),
+            "attempts": self.attempts,
+            "score": round(self.score(), 1),
+        }
+
+
+def _smooth(previous: float | None, value: float) -> float:
+    if previous is None:
+        return float(value)
+    return previous + SOURCE_SCORE_SMOOTHING * (value - previous)
+
+
+class SourceScoreboard:
+    """
+    Keep a rolling score per Bluetooth source for one bike and rank the
+    sources that currently see it, best first.
+    """
+
+    def __init__(self) -> None:
+        self._scores: dict[str, SourceScore] = {}
+
+    def _score(self, source: str) -> SourceScore:
+        score = self._scores.get(source)
+        if score is None:
+            score = self._scores[source] = SourceScore()
+        return score
+
+    def record_rssi(self, source: str, rssi: int | None) -> None:
+        """Fold an advertisement RSSI into the source's score."""
+        if rssi is not None:
+            score = self._score(source)
+            score.rssi = _smooth(score.rssi, rssi)
+
+    def record_connect(self, source: str, seconds: float) -> None:
+        """Record a successful connection and how long it took."""
+        score = self._score(source)
+        score.attempts += 1
+        score.connect_time = _smooth(score.connect_time, seconds)
+        score.failure_rate = _smooth(score.failure_rate, 0.0)
+
+    def record_failure(self, source: str) -> None:
+        """Record a failed connection attempt."""
+        score = self._score(source)
+        score.attempts += 1
+        score.failure_rate = _smooth(score.failure_rate, 1.0)
+
+    def rank(self, candidates: list[tuple[str, Any, int | None]]) -> list[tuple[str, Any]]:
+        """Order ``(source, device, rssi)`` candidates by score, best first."""
+        ranked = sorted(
+            candidates,
+            key=lambda candidate: self._score(candidate[0]).score(candidate[2]),
+            reverse=True,
+        )
+        return [(source, device) for source, device, _rssi in ranked]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the scores per source for diagnostics."""
+        return {source: score.as_dict() for source, score in self._scores.items()}
@@ -1,10 +1,25 @@
+import logging
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
 from enum import Enum
+from typing import Any
 
 import bleak.backends.client
 
-from .bleak_client_utils import read_from_characteristic, write_to_characteristic
+from .bleak_client_utils import (
+    read_from_characteristic,
+    start_notify_on_characteristic,
+    stop_notify_on_characteristic,
+    write_to_characteristic,
+)
 from .sx3_profile import SX3Profile
 
+_LOGGER = logging.getLogger(__name__)
+
+# Seconds a reused or prefetched challenge stays eligible for the next write
+_NONCE_REUSE_WINDOW = 10.0
+
 
 class BellTone(Enum):
 
@@ -54,6 +69,36 @@ class Sound(Enum):
     FM_NOISE = 0x1D
 
 
+def _consume_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def _first_byte(result: bytes) -> int:
+    return int(result[0])
+
+
+def _little_endian(result: bytes) -> int:
+    return int.from_bytes(result, "little")
+
+
+# Encrypted characteristics readable in bulk through ``SX3Client.get_many``, with
+# the same decoding as the matching getter.
+_FIELDS = {
+    "battery_level": (SX3Profile.BikeInfo.MOTOR_BATTERY_LEVEL, _first_byte),
+    "lock_state": (SX3Profile.Defense.LOCK_STATE, lambda result: LockState(result[0])),
+    "distance_travelled": (SX3Profile.Movement.DISTANCE, lambda result: _little_endian(result) / 10),
+    "module_level": (SX3Profile.BikeInfo.MODULE_BATTERY_LEVEL, _first_byte),
+    "power_level": (SX3Profile.Movement.POWER_LEVEL, lambda result: result),
+    "speed": (SX3Profile.Movement.SPEED, _little_endian),
+    "light_mode": (SX3Profile.Light.LIGHT_MODE, _first_byte),
+    "module_state": (SX3Profile.BikeState.MODULE_STATE, _first_byte),
+    "errors": (SX3Profile.BikeState.ERRORS, _little_endian),
+    "motor_battery_state": (SX3Profile.BikeInfo.MOTOR_BATTERY_STATE, _first_byte),
+    "module_battery_state": (SX3Profile.BikeInfo.MODULE_BATTERY_STATE, _first_byte),
+}
+
+
 class SX3Client:
     """
     A wrapper around a bleak client that allows bluetooth communication with a Vanmoof S3 and X3.
@@ -61,7 +106,7 @@ class SX3Client:
     You must provide this object with a connected BleakClient and a hexidecimal string formatted key
     for the bike.
 
-    :param bleak_client: Connected bleak.backends.client.BaseBleakClient
+    :param bleak_client: Connected bleak.backends.client.BaseBleakClient, or any other GattTransport
     :param key: The encryption key for the bike from Vanmoof servers
     :param user_key_id: The user key id for the bike from Vanmoof servers
     """
@@ -75,6 +120,16 @@ class SX3Client:
 
         self._gatt_client = bleak_client
         self._bike_profile = SX3Profile(key, user_key_id)
+        self._subscriptions: list = []
+
+        # Command pipeline state: whether the bike keeps its challenge across writes
+        # (None until the first write tells us), a nonce known to be valid for the
+        # next write, and a challenge read prefetched in the background.
+        self._nonce_reusable: bool | None = None
+        self._next_nonce: bytes | None = None
+        self._nonce_prefetch: asyncio.Task | None = None
+        self._next_nonce_at = 0.0
+        self._write_lock = asyncio.Lock()
 
     async def _get_nonce(self) -> bytes:
         return await self._read(
@@ -94,7 +149,22 @@ class SX3Client:
         return result
 
     async def _write(self, characteristic_uuid, data: bytes) -> None:
-        nonce = await self._get_nonce()
+        async with self._write_lock:
+            nonce, pipelined = await self._take_nonce()
+            try:
+                await self._write_with_nonce(characteristic_uuid, data, nonce)
+            except Exception as err:
+                if not pipelined:
+                    raise
+                # The bike rejected a reused or prefetched nonce; fall back to a fresh challenge.
+                _LOGGER.debug("Write with pipelined nonce failed, retrying with a fresh challenge: %s", err)
+                self._nonce_reusable = False
+                nonce = await self._get_nonce()
+                await self._write_with_nonce(characteristic_uuid, data, nonce)
+
+            await self._after_write(nonce)
+
+    async def _write_with_nonce(self, characteristic_uuid, data: bytes, nonce: bytes) -> None:
         payload = self._bike_profile.build_encrypted_payload(nonce, data)
 
         await write_to_characteristic(
@@ -103,6 +173,49 @@ class SX3Client:
             payload,
         )
 
+    async def _take_nonce(self) -> tuple[bytes, bool]:
+        """Return a nonce for the next write and whether it was pipelined rather than read now."""
+        nonce, self._next_nonce = self._next_nonce, None
+        prefetch, self._nonce_prefetch = self._nonce_prefetch, None
+        if time.monotonic() - self._next_nonce_at > _NONCE_REUSE_WINDOW:
+            nonce = None
+            if prefetch is not None:
+                prefetch.cancel()
+                prefetch = None
+
+        if nonce is not None:
+            return nonce, True
+
+        if prefetch is not None:
+            try:
+                return await prefetch, True
+            except Exception as err:
+                _LOGGER.debug("Prefetched challenge read failed: %s", err)
+
+        return await self._get_nonce(), False
+
+    async def _after_write(self, nonce: bytes) -> None:
+        """Prepare the nonce for the next write once the current write completed."""
+        self._next_nonce_at = time.monotonic()
+        if self._nonce_reusable is None:
+            # Learn once per connection whether a write rotates the challenge. The
+            # challenge read here is fresh either way, so it serves the next write.
+            next_nonce = await self._get_nonce()
+            self._nonce_reusable = next_nonce == nonce
+            self._next_nonce = next_nonce
+            _LOGGER.debug("Bike %s the challenge across writes.", "keeps" if self._nonce_reusable else "rotates")
+        elif self._nonce_reusable:
+            self._next_nonce = nonce
+        else:
+            self._nonce_prefetch = asyncio.ensure_future(self._get_nonce())
+            self._nonce_prefetch.add_done_callback(_consume_exception)
+
+    def _reset_nonce_pipeline(self) -> None:
+        self._next_nonce = None
+        prefetch, self._nonce_prefetch = self._nonce_prefetch, None
+        if prefetch is not None:
+            prefetch.cancel()
+
     async def authenticate(self) -> None:
         """
         Attempts to authenticate with the bike by performing the nonce challenge.
@@ -111,6 +224,11 @@ class SX3Client:
             This method will not check if you have successfully authenticated
             and will silently return.
         """
+        async with self._write_lock:
+            await self._authenticate()
+
+    async def _authenticate(self) -> None:
+        self._reset_nonce_pipeline()
         nonce = await self._get_nonce()
         payload = self._bike_profile.build_authentication_payload(nonce)
 
@@ -120,6 +238,112 @@ class SX3Client:
             payload,
         )
 
+    async def get_many(
+        self,
+        names: list[str],
+        limiter: Callable[[Callable[[], Awaitable[bytes]]], Awaitable[bytes]] | None = None,
+    ) -> dict[str, Any]:
+        """
+        **Must be authenticated to call**
+
+        Reads several values together. All payloads are read first and then
+        decrypted in a single ``SX3Profile.decrypt_many`` call.
+
+        :param names: Field names, e.g. ``"battery_level"`` or ``"lock_state"``.
+        :param limiter: Optional wrapper that runs each read, e.g. to bound the
+            number of reads in flight.
+        :return: A dict of field name to decoded value, or to the exception raised
+            while reading or decoding that field.
+        """
+        reads = []
+        for name in names:
+            characteristic_uuid = _FIELDS[name][0]
+
+            def _reader(characteristic_uuid=characteristic_uuid) -> Awaitable[bytes]:
+                return read_from_characteristic(self._gatt_client, characteristic_uuid)
+
+            reads.append(limiter(_reader) if limiter else _reader())
+
+        payloads = await asyncio.gather(*reads, return_exceptions=True)
+
+        results: dict[str, Any] = {}
+        encrypted = {}
+        for name, payload in zip(names, payloads):
+            if isinstance(payload, BaseException):
+                results[name] = payload
+            else:
+                encrypted[name] = bytes(payload)
+
+        try:
+            decrypted = self._bike_profile.decrypt_many(list(encrypted.values()))
+        except ValueError:
+            # A malformed payload; fall back to decrypting them one at a time.
+            decrypted = []
+            for payload in encrypted.values():
+                try:
+                    decrypted.append(self._bike_profile.decrypt_payload(payload))
+                except ValueError as err:
+                    decrypted.append(err)
+
+        for name, result in zip(encrypted, decrypted):
+            if isinstance(result, BaseException):
+                results[name] = result
+                continue
+            try:
+                results[name] = _FIELDS[name][1](result)
+            except Exception as err:
+                results[name] = err
+
+        return {name: results[name] for name in names}
+
+    async def subscribe(self, callback: Callable[[str, Any], None]) -> None:
+        """
+        **Must be authenticated to call**
+
+        Subscribes to lock state, speed and motor battery level notifications.
+        Every notification is decrypted and decoded the same way as the matching
+        getter, then passed to ``callback`` together with its field name
+        (``"lock_state"``, ``"speed"`` or ``"battery_level"``).
+
+        :param callback: Called as ``callback(name, value)`` for each notification.
+        :raises ``bleak.exc.BleakError``: if the client is not authenticated.
+        """
+        for name in ("lock_state", "speed", "battery_level"):
+            characteristic_uuid, parse = _FIELDS[name]
+            await start_notify_on_characteristic(
+                self._gatt_client,
+                characteristic_uuid,
+                self._notification_handler(name, parse, callback),
+            )
+            self._subscriptions.append(characteristic_uuid)
+
+    async def unsubscribe(self) -> None:
+        """
+        Stops all notifications started by ``subscribe``.
+        """
+        subscriptions, self._subscriptions = self._subscriptions, []
+        for characteristic_uuid in subscriptions:
+            try:
+                await stop_notify_on_characteristic(self._gatt_client, characteristic_uuid)
+            except Exception as err:
+                _LOGGER.debug("Unable to stop notifications for %s: %s", characteristic_uuid, err)
+
+    def _notification_handler(
+        self,
+        name: str,
+        parse: Callable[[bytes], Any],
+        callback: Callable[[str, Any], None],
+    ) -> Callable[[Any, bytearray], None]:
+        def _handle(_sender, data: bytearray) -> None:
+            try:
+                value = parse(self._bike_profile.decrypt_payload(bytes(data)))
+            except Exception as err:
+                _LOGGER.debug("Unable to decode %s notification: %s", name, err)
+                return
+            callback(name, value)
+
+        return _handle
+
     async def set_bell_tone(self, bell_tone: BellTone) -> None:
         """
         **Must be authenticated to call**
@@ -1,12 +1,13 @@
 import enum
-import math
 
 from cryptography.hazmat.primitives.ciphers import algorithms
 from cryptography.hazmat.primitives.ciphers import Cipher
 from cryptography.hazmat.primitives.ciphers import modes
 
+from .ecb_payload import BLOCK_SIZE, EcbPayloadDecryptor
 
-class SX3Profile:
+
+class SX3Profile(EcbPayloadDecryptor):
     """
     Represents the profile for the GATT UUIDs for the S3/X3. Also contains functionality
     to encrypt and decrypt BLE payloads, as well as building the authentication payload.
@@ -19,32 +20,26 @@ class SX3Profile:
         self._cipher = Cipher(algorithms.AES(bytes.fromhex(key)), modes.ECB())
         self._user_key_id = user_key_id
 
+        # ECB carries no state between blocks, so one context of each kind can be
+        # reused for every block-aligned payload instead of being rebuilt per call.
+        self._encryptor = self._cipher.encryptor()
+        self._decryptor = self._cipher.decryptor()
+
     def build_authentication_payload(self, nonce: bytes) -> bytes:
         """
         Builds the authentication payload given a nonce.
 
         :param nonce: A bytes array that represents the nonce from a challenge response.
         """
-        encryptor = self._cipher.encryptor()
-
         data = bytearray(16)
         data[0:2] = nonce
-        data = bytearray(encryptor.update(data) + encryptor.finalize())
+        data = bytearray(self._encryptor.update(bytes(data)))
 
         # Append the user key id
         data.extend([0, 0, 0, self._user_key_id])
 
         return bytes(data)
 
-    def decrypt_payload(self, data: bytes) -> bytes:
-        """
-        Decrypts a bluetooth payload.
-
-        :param data: A bytes array of data. Must be a multiple of 16 bytes long.
-        """
-        decryptor = self._cipher.decryptor()
-        return decryptor.update(data) + decryptor.finalize()
-
     def build_encrypted_payload(self, nonce: bytes, data: bytes) -> bytes:
         """
         Encrypts data signed with a nonce. This will build a payload and pad with
@@ -53,17 +48,14 @@ class SX3Profile:
         :param nonce: A bytes array that represents the nonce from a challenge response.
         :param data: A bytes array of data.
         """
-        encryptor = self._cipher.encryptor()
-
         payload = bytearray(16)
         payload[0:2] = nonce
         payload[2:] = data
 
         # Pad to the nearest cipher 16 byte block size
-        for _ in range(math.ceil(len(payload) / 16) * 16 - len(payload)):
-            payload.append(0)
+        payload.extend(bytes(-len(payload) % BLOCK_SIZE))
 
-        return bytes(encryptor.update(payload) + encryptor.finalize())
+        return self._encryptor.update(bytes(payload))
 
     class Security(enum.Enum):
 
@@ -1,4 +1,5 @@
 import logging
+import struct
 from enum import Enum
 import bleak.backends.client
 from bleak import BleakScanner, BleakClient
@@ -12,6 +13,73 @@ class LockState(Enum):
     LOCKED = 0x01
     AWAITING_UNLOCK = 0x02
 
+# Bike.PARAMETERS layout: module state (2), lock state (3), battery (5), module
+# battery (6), light mode (7), power level (8), region (9), distance in hectometers
+# (11-14) and a flags byte (15) with charging in bit 0 and the error code in bits 3-7.
+_PARAMETERS = struct.Struct("<2xBBxBBBBBxIB")
+
+# Smallest payload length that contains each field, in _PARAMETERS order
+_PARAMETER_MIN_LENGTHS = (3, 4, 6, 7, 8, 9, 10, 15, 16)
+
+_REGIONS = {
+    0: "UNSUPPORTED",
+    1: "EU",
+    2: "US",
+    3: "OFFROAD",
+    4: "JAPAN",
+}
+
+
+class SXParameters:
+    """Decoded snapshot of the SX ``Bike.PARAMETERS`` characteristic."""
+
+    __slots__ = (
+        "module_state",
+        "lock_state",
+        "battery_level",
+        "module_level",
+        "light_mode",
+        "power_level",
+        "region",
+        "distance",
+        "charging",
+        "error_code",
+    )
+
+    def __init__(self, data: bytes) -> None:
+        view = memoryview(data)
+        if len(view) >= _PARAMETERS.size:
+            fields = _PARAMETERS.unpack_from(view)
+        else:
+            # Short payload: decode what is there and leave the missing fields empty.
+            padded = bytes(view) + bytes(_PARAMETERS.size - len(view))
+            fields = tuple(
+                value if len(view) >= min_length else None
+                for value, min_length in zip(_PARAMETERS.unpack(padded), _PARAMETER_MIN_LENGTHS)
+            )
+
+        (
+            self.module_state,
+            self.lock_state,
+            self.battery_level,
+            self.module_level,
+            self.light_mode,
+            self.power_level,
+            region_code,
+            distance,
+            flags,
+        ) = fields
+
+        self.region = _REGIONS.get(region_code, "UNKNOWN") if region_code is not None else None
+        self.distance = distance / 10 if distance is not None else None
+        self.error_code = (flags & 0xF8) >> 3 if flags is not None else None
+        self.charging = "CHARGING" if flags is not None and flags & 0x01 else "OFF"
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"SXParameters({fields})"
+
+
 class SXClient:
     """
     A wrapper around a bleak client that allows bluetooth communication with a Vanmoof S and X.
@@ -24,6 +92,7 @@ class SXClient:
     ) -> None:
         self._gatt_client = bleak_client
         self._bike_profile = SXProfile(encryption_key)
+        self._parameters: SXParameters | None = None
 
     async def _get_nonce(self) -> bytes:
         return await self._read(
@@ -44,74 +113,35 @@ class SXClient:
             _LOGGER.error(f"Failed to read characteristic {characteristic_uuid}: {e}")
             raise
         
+    async def _get_parameters_snapshot(self) -> SXParameters:
+        """Return the last decoded parameters, reading them only if none were read yet."""
+        if self._parameters is None:
+            return await self.get_parameters()
+        return self._parameters
+
 # we try to read a parameter to be sure, the connection is ok
     async def get_discovery(self) -> int: 
         try:
-            result = await self._read(self._bike_profile.Bike.PARAMETERS)
-
-            _LOGGER.debug(f"Battery data: {result}")
-            battery_level = int(result[5])
-            
-            return battery_level
+            parameters = await self._get_parameters_snapshot()
+            return parameters.battery_level
         except Exception as e:
             _LOGGER.error(f"Failed to get parameters: {e}")
             raise
 
-    async def get_parameters(self) -> dict:
+    async def get_parameters(self) -> SXParameters:
+        """
+        Reads and decodes ``Bike.PARAMETERS`` in one pass. The result is kept as
+        the snapshot used by the other parameter-based getters.
+        """
         try:
             result = await self._read(self._bike_profile.Bike.PARAMETERS)
+            parameters = SXParameters(result)
+            self._parameters = parameters
+
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Parameters: %r", parameters)
 
-            _LOGGER.debug(f"Parameters data: {result}")
-            
-            module_state = int(result[2]) if len(result) > 2 else None
-            lock_state = int(result[3]) if len(result) > 3 else None
-            battery_level = int(result[5]) if len(result) > 5 else None
-            module_level = int(result[6]) if len(result) > 6 else None
-            light_mode = int(result[7]) if len(result) > 7 else None
-            power_level = int(result[8]) if len(result) > 8 else None
-            region_code = int(result[9]) if len(result) > 9 else None
-            
-            if len(result) > 14:
-                distance = result[11] + (result[12] << 8) + (result[13] << 16) + (result[14] << 24)
-                distance_km = distance / 10
-            else:
-                distance_km = None
-
-            error_code = (result[15] & 0xF8) >> 3 if len(result) > 15 else None
-            charging = "CHARGING" if len(result) > 15 and (result[15] & 0x01) else "OFF"
-
-            region_mapping = {
-                0: "UNSUPPORTED",
-                1: "EU",
-                2: "US",
-                3: "OFFROAD",
-                4: "JAPAN",
-            }
-            region = region_mapping.get(region_code, "UNKNOWN") if region_code is not None else None
-
-            _LOGGER.debug(f"Battery level: {battery_level}%")
-            _LOGGER.debug(f"Module level: {module_level}%")
-            _LOGGER.debug(f"Module state: {module_state}")
-            _LOGGER.debug(f"Lock state: {lock_state}")
-            _LOGGER.debug(f"Light mode: {light_mode}")
-            _LOGGER.debug(f"Power level: {power_level}")
-            _LOGGER.debug(f"Region: {region}")
-            _LOGGER.debug(f"Distance: {distance_km} km")
-            _LOGGER.debug(f"Charging: {charging}")
-            _LOGGER.debug(f"Error code: {error_code}")
-
-            return {
-                "battery_level": battery_level,
-                "module_level": module_level,
-                "module_state": module_state,
-                "lock_state": lock_state,
-                "light_mode": light_mode,
-                "power_level": power_level,
-                "distance": distance_km,
-                "region": region,
-                "charging": charging,
-                "error_code": error_code,
-            }
+            return parameters
         except Exception as e:
             _LOGGER.error(f"Failed to get parameters: {e}")
             raise
@@ -221,8 +251,7 @@ class SXClient:
         Gets the module battery level for SX1/S1 bikes.
         """
         try:
-            result = await self._read(self._bike_profile.Bike.PARAMETERS)
-            module_level = int(result[6])
+            module_level = (await self._get_parameters_snapshot()).module_level
             _LOGGER.info(f"Module battery level: {module_level}%")
             return module_level
         except AttributeError as e:
@@ -239,10 +268,7 @@ class SXClient:
         Gets the current error codes for SX1/S1 bikes.
         """
         try:
-            # Error codes are typically in a dedicated characteristic or part of parameters
-            result = await self._read(self._bike_profile.Bike.PARAMETERS)
-            # Error code is at a specific position in the parameters
-            error_code = int.from_bytes(result[7:9], "little") if len(result) > 8 else 0
+            error_code = (await self._get_parameters_snapshot()).error_code
             _LOGGER.info(f"Error codes: {error_code}")
             return error_code
         except AttributeError as e:
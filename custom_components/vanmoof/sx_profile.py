@@ -7,11 +7,13 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import padding
 
+from .ecb_payload import EcbPayloadDecryptor
+
 import logging
 _LOGGER = logging.getLogger(__name__)
 
 
-class SXProfile:
+class SXProfile(EcbPayloadDecryptor):
     """
     Represents the profile for the GATT UUIDs for the SX1/SX2 bikes. Contains functionality
     to encrypt and decrypt BLE payloads and handle authentication for SX models.
@@ -45,16 +47,10 @@ class SXProfile:
                 backend=default_backend()
             )
 
+            # One decryptor serves every payload; see EcbPayloadDecryptor
+            self._decryptor = self._cipher.decryptor()
 
 
-    def decrypt_payload(self, data: bytes) -> bytes:
-        """
-        Decrypts a Bluetooth payload.
-
-        :param data: A bytes array of data. Must be a multiple of 16 bytes long.
-        """
-        decryptor = self._cipher.decryptor()
-        return decryptor.update(data) + decryptor.finalize()
 
  
 
@@ -0,0 +1,227 @@
+"""Bounded in-memory history of VanMoof bike telemetry."""
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from .const import (
+    CHARGE_RATE_MIN_SPAN,
+    CHARGE_RATE_WINDOW,
+    CONSUMPTION_MIN_DISTANCE,
+    CONSUMPTION_WINDOW,
+    TELEMETRY_RAW_SAMPLES,
+    TELEMETRY_TIERS,
+)
+from .snapshot import BikeSnapshot
+
+FIELDS = ("battery_level", "module_level", "distance_travelled", "speed", "lock_state")
+# Fields averaged over a downsampled bucket; the others keep the bucket's last value
+_MEAN_FIELDS = frozenset({"speed"})
+# Lock states are stored as their index here
+LOCK_STATES = ("UNLOCKED", "LOCKED", "AWAITING_UNLOCK")
+
+_INDEX = {name: index for index, name in enumerate(FIELDS)}
+
+
+def _encode(name: str, value: Any) -> float:
+    if value is None:
+        return math.nan
+    if name == "lock_state":
+        return float(LOCK_STATES.index(value)) if value in LOCK_STATES else math.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+class TelemetryRing:
+    """
+    Fixed-size ring of timestamped samples with one value per field.
+
+    Timestamps are doubles, values single-precision floats with NaN for
+    missing readings, so a slot costs 28 bytes whatever the bike reports.
+    """
+
+    __slots__ = ("_times", "_values", "_next", "_size")
+
+    def __init__(self, capacity: int) -> None:
+        self._times = array("d", bytes(8 * capacity))
+        self._values = [array("f", bytes(4 * capacity)) for _name in FIELDS]
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def oldest(self) -> float | None:
+        """Return the timestamp of the oldest sample."""
+        if not self._size:
+            return None
+        return self._times[(self._next - self._size) % len(self._times)]
+
+    def append(self, timestamp: float, values: Sequence[float]) -> None:
+        """Add a sample, overwriting the oldest once the ring is full."""
+        position = self._next
+        self._times[position] = timestamp
+        for column, value in zip(self._values, values):
+            column[position] = value
+        self._next = (position + 1) % len(self._times)
+        self._size = min(self._size + 1, len(self._times))
+
+    def rows(self, indexes: Sequence[int], since: float, until: float) -> Iterator[tuple[float, ...]]:
+        """
+        Yield ``(timestamp, value, ...)`` for the given fields, oldest first,
+        skipping samples where any of them is missing.
+        """
+        capacity = len(self._times)
+        columns = [self._values[index] for index in indexes]
+        for offset in range(self._size):
+            position = (self._next - self._size + offset) % capacity
+            timestamp = self._times[position]
+            if timestamp < since or timestamp >= until:
+                continue
+            values = tuple(column[position] for column in columns)
+            total = sum(values)
+            if total != total:  # NaN: a field is missing
+                continue
+            yield (timestamp, *values)
+
+
+class _Tier:
+    """Downsample samples into fixed buckets and keep the last ``buckets`` of them."""
+
+    __slots__ = ("resolution", "ring", "_start", "_time", "_sums", "_counts", "_last")
+
+    def __init__(self, resolution: int, buckets: int) -> None:
+        self.resolution = resolution
+        self.ring = TelemetryRing(buckets)
+        self._start: float | None = None
+        self._time = 0.0
+        self._sums = [0.0] * len(FIELDS)
+        self._counts = [0] * len(FIELDS)
+        self._last = [math.nan] * len(FIELDS)
+
+    def add(self, timestamp: float, values: Sequence[float]) -> None:
+        start = timestamp - timestamp % self.resolution
+        if self._start is not None and start != self._start:
+            self._flush()
+        self._start = start
+        self._time = timestamp
+        for index, value in enumerate(values):
+            if value == value:
+                self._sums[index] += value
+                self._counts[index] += 1
+                self._last[index] = value
+
+    def _flush(self) -> None:
+        self.ring.append(
+            self._time,
+            [
+                (self._sums[index] / self._counts[index] if self._counts[index] else math.nan)
+                if name in _MEAN_FIELDS
+                else self._last[index]
+                for index, name in enumerate(FIELDS)
+            ],
+        )
+        self._sums = [0.0] * len(FIELDS)
+        self._counts = [0] * len(FIELDS)
+        self._last = [math.nan] * len(FIELDS)
+
+
+class BikeTelemetry:
+    """
+    History of one bike's readings in memory of fixed size.
+
+    Every reading goes into a ring of the latest ``TELEMETRY_RAW_SAMPLES``
+    samples and into each downsampled tier of ``TELEMETRY_TIERS``, by default
+    5-minute buckets for a day and hourly buckets for 30 days. Queries read the
+    finest tier that still holds a period, so recent history is exact and older
+    history is coarse, and memory does not grow with the polling rate or uptime.
+    """
+
+    def __init__(
+        self,
+        raw_samples: int = TELEMETRY_RAW_SAMPLES,
+        tiers: Sequence[tuple[int, int]] = TELEMETRY_TIERS,
+    ) -> None:
+        self._raw = TelemetryRing(raw_samples)
+        self._tiers = [_Tier(resolution, buckets) for resolution, buckets in tiers]
+
+    def add(self, data: BikeSnapshot, timestamp: float | None = None) -> None:
+        """Record a reading of the bike."""
+        if timestamp is None:
+            timestamp = time.time()
+        values = [_encode(name, getattr(data, name)) for name in FIELDS]
+        self._raw.append(timestamp, values)
+        for tier in self._tiers:
+            tier.add(timestamp, values)
+
+    def rows(self, names: Sequence[str], since: float) -> list[tuple[float, ...]]:
+        """
+        Return ``(timestamp, value, ...)`` rows of the given fields from ``since``
+        on, oldest first, each period taken from the finest tier that holds it.
+        Lock states are indexes into ``LOCK_STATES``.
+        """
+        indexes = [_INDEX[name] for name in names]
+        rows: list[tuple[float, ...]] = []
+        until = math.inf
+        for ring in (self._raw, *(tier.ring for tier in self._tiers)):
+            oldest = ring.oldest
+            if oldest is None:
+                continue
+            rows[:0] = ring.rows(indexes, since, until)
+            if oldest <= since:
+                break
+            until = min(until, oldest)
+        return rows
+
+    def charge_rate(self, now: float | None = None) -> float | None:
+        """
+        Return how fast the battery level rose over the last
+        ``CHARGE_RATE_WINDOW`` seconds in percent per hour, 0 when it did not.
+        """
+        if now is None:
+            now = time.time()
+        rows = self.rows(("battery_level",), now - CHARGE_RATE_WINDOW)
+        if len(rows) < 2 or rows[-1][0] - rows[0][0] < CHARGE_RATE_MIN_SPAN:
+            return None
+        # Least-squares slope; single readings move in whole percents.
+        mean_time = sum(row[0] for row in rows) / len(rows)
+        mean_level = sum(row[1] for row in rows) / len(rows)
+        spread = sum((row[0] - mean_time) ** 2 for row in rows)
+        if not spread:
+            return None
+        slope = sum((row[0] - mean_time) * (row[1] - mean_level) for row in rows) / spread
+        return max(slope * 3600, 0.0)
+
+    def consumption(self, now: float | None = None) -> float | None:
+        """
+        Return battery percent used per km ridden over the last
+        ``CONSUMPTION_WINDOW`` seconds. Steps where the battery level rose are
+        left out, so charging in between does not count.
+        """
+        if now is None:
+            now = time.time()
+        rows = self.rows(("battery_level", "distance_travelled"), now - CONSUMPTION_WINDOW)
+        used = ridden = 0.0
+        for (_time, level, distance), (_next_time, next_level, next_distance) in zip(rows, rows[1:]):
+            if next_distance > distance and next_level <= level:
+                used += level - next_level
+                ridden += next_distance - distance
+        if ridden < CONSUMPTION_MIN_DISTANCE:
+            return None
+        return used / ridden
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the size of each tier for diagnostics."""
+        return {
+            "raw": {"samples": len(self._raw), "oldest": self._raw.oldest},
+            **{
+                f"{tier.resolution}s": {"samples": len(tier.ring), "oldest": tier.ring.oldest}
+                for tier in self._tiers
+            },
+        }
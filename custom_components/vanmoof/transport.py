@@ -0,0 +1,131 @@
+"""Home Assistant Bluetooth transport for VanMoof bikes."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+
+from bleak.backends.device import BLEDevice
+from homeassistant.components import bluetooth
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .bleak_client_utils import connect_bleak_client
+from .const import DATA_GATT_CONNECTOR, DOMAIN
+from .gatt_transport import GattConnector
+
+
+@callback
+def async_resolve_connectable_device(
+    hass: HomeAssistant,
+    addresses: Iterable[str | None],
+) -> BLEDevice | None:
+    """
+    Return the BLE device for the first address that a connectable adapter or
+    proxy can reach. Home Assistant picks the path with the best signal.
+    """
+    for address in addresses:
+        if not address:
+            continue
+        device = bluetooth.async_ble_device_from_address(hass, address, connectable=True)
+        if device is not None:
+            return device
+    return None
+
+
+@callback
+def async_connectable_candidates(
+    hass: HomeAssistant,
+    addresses: Iterable[str | None],
+) -> list[tuple[str, BLEDevice, int | None]]:
+    """
+    Return ``(source, device, rssi)`` for every connectable adapter or proxy
+    that currently sees the first reachable address.
+    """
+    scanner_devices_by_address = getattr(bluetooth, "async_scanner_devices_by_address", None)
+    for address in addresses:
+        if not address:
+            continue
+
+        if scanner_devices_by_address is None:
+            # Older Home Assistant: only the best path is exposed.
+            device = bluetooth.async_ble_device_from_address(hass, address, connectable=True)
+            if device is not None:
+                details = device.details if isinstance(device.details, dict) else {}
+                return [(str(details.get("source", "default")), device, getattr(device, "rssi", None))]
+            continue
+
+        candidates = [
+            (
+                scanner_device.scanner.source,
+                scanner_device.ble_device,
+                scanner_device.advertisement.rssi,
+            )
+            for scanner_device in scanner_devices_by_address(hass, address, connectable=True)
+        ]
+        if candidates:
+            return candidates
+    return []
+
+
+@callback
+def async_ble_device_callback(
+    hass: HomeAssistant,
+    device: BLEDevice,
+) -> Callable[[], BLEDevice]:
+    """Build a callback that re-resolves ``device`` before each connection retry."""
+
+    def _resolve() -> BLEDevice:
+        return async_resolve_connectable_device(hass, (device.address,)) or device
+
+    return _resolve
+
+
+@callback
+def async_register_advertisement_callback(
+    hass: HomeAssistant,
+    advertisement_callback: Callable[[BLEDevice, int | None], None],
+) -> CALLBACK_TYPE:
+    """
+    Receive every advertisement seen by Home Assistant's shared scanners,
+    including remote proxies, without starting a scan of our own.
+    """
+
+    @callback
+    def _async_on_advertisement(
+        service_info: bluetooth.BluetoothServiceInfoBleak,
+        change: bluetooth.BluetoothChange,
+    ) -> None:
+        advertisement_callback(service_info.device, service_info.rssi)
+
+    return bluetooth.async_register_callback(
+        hass,
+        _async_on_advertisement,
+        bluetooth.BluetoothCallbackMatcher(connectable=False),
+        bluetooth.BluetoothScanningMode.PASSIVE,
+    )
+
+
+@callback
+def async_discovered_devices(hass: HomeAssistant) -> list[BLEDevice]:
+    """Return the connectable devices Home Assistant currently knows about."""
+    return [
+        service_info.device
+        for service_info in bluetooth.async_discovered_service_info(hass, connectable=True)
+    ]
+
+
+@callback
+def async_get_gatt_connector(hass: HomeAssistant) -> GattConnector:
+    """Return the connector used to open GATT links to bikes."""
+    return hass.data.get(DOMAIN, {}).get(DATA_GATT_CONNECTOR, connect_bleak_client)
+
+
+@callback
+def async_set_gatt_connector(hass: HomeAssistant, connector: GattConnector | None) -> None:
+    """
+    Replace the GATT connector for every bike set up afterwards, e.g. with a
+    simulated peripheral. ``None`` restores the bleak connector.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if connector is None:
+        domain_data.pop(DATA_GATT_CONNECTOR, None)
+    else:
+        domain_data[DATA_GATT_CONNECTOR] = connector
@@ -3,22 +3,65 @@ from __future__ import annotations
 
 import logging
 import asyncio
+import time
+from collections import deque
 from collections.abc import Awaitable, Callable
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Any
 
-from bleak import BleakScanner
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import CONF_POLLING_INTERVAL, DEFAULT_POLLING_INTERVAL, DOMAIN
-from .bleak_client_utils import connect_bleak_client
+from .const import (
+    BATTERY_FULL_PLAUSIBLE_FROM,
+    BATTERY_HISTORY_SIZE,
+    CONF_ADAPTIVE_POLLING,
+    CONF_CHARGE_TARGET,
+    CONF_POLLING_INTERVAL,
+    CONF_SESSION_IDLE_TIMEOUT,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_CHARGE_TARGET,
+    DEFAULT_CONNECT_ATTEMPTS,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SESSION_IDLE_TIMEOUT,
+    DOMAIN,
+    MAX_CONCURRENT_GATT_READS,
+    MIN_POLLING_INTERVAL,
+    PRESENCE_STARTUP_WAIT,
+)
+from .charge_session import ChargeSessionTracker
+from .circuit_breaker import BikeCircuitBreaker
+from .connection_arbiter import async_get_connection_arbiter
+from .presence import VanMoofPresence, async_get_scan_broker
+from .range_estimator import RangeEstimator
+from .refresh_timings import RefreshTimings
+from .scheduler import AdaptivePollingScheduler
+from .session import ConnectionSlotTimeout, VanMoofSession
+from .snapshot import ABSENT, FIELD_NAMES, BikeSnapshot
+from .snapshot_store import StoredSnapshot, async_get_snapshot_store
+from .source_scoring import SourceScoreboard
+from .telemetry import BikeTelemetry
 from .sx_client import SXClient
 from .sx3_client import SX3Client
+from .transport import (
+    async_ble_device_callback,
+    async_connectable_candidates,
+    async_get_gatt_connector,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_SX_LOCK_STATES = {0: "UNLOCKED", 1: "LOCKED", 2: "AWAITING_UNLOCK"}
+_SX_MODULE_STATES = {
+    0: "ON", 1: "OFF", 2: "SHIPPING", 3: "STANDBY",
+    4: "ALARM_ONE", 5: "ALARM_TWO", 6: "ALARM_THREE", 7: "SLEEPING", 8: "TRACKING"
+}
+_SX_LIGHT_MODES = {0: "AUTO", 1: "ON", 2: "OFF", 3: "REAR_FLASH", 4: "REAR_FLASH_OFF"}
+
+# Listed in changed_fields when a charge session started or ended
+CHARGE_SESSION_FIELD = "charge_session"
+
 
 def _is_sx3_bike(vanmoof_type: str | None, bike_model: str | None = None) -> bool:
     value = f"{vanmoof_type or ''} {bike_model or ''}".upper()
@@ -81,6 +124,10 @@ def _log_possible_mac_mismatch(device, mac_address: str) -> None:
         )
 
 
+class BikeUnreachable(UpdateFailed):
+    """The bike advertises but could not be connected to."""
+
+
 class VanMoofDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage VanMoof bike data updates."""
 
@@ -107,107 +154,367 @@ class VanMoofDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=update_interval,
         )
 
-    async def _async_update_data(self):
-        """Fetch data from the bike via BLE."""
-        try:
-            devices = await BleakScanner.discover(timeout=8.0)
-            _LOGGER.debug("Discovered %s BLE devices while searching for VanMoof bike.", len(devices))
+        self._scheduler = AdaptivePollingScheduler(
+            polling_interval_seconds,
+            entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+        )
+        self._circuit_breaker = BikeCircuitBreaker()
+        self._source_scores = SourceScoreboard()
+        self._timings = RefreshTimings()
+        self._telemetry = BikeTelemetry()
+        self._range = RangeEstimator()
+        self._charge = ChargeSessionTracker()
+        self._charge_target = entry.options.get(CONF_CHARGE_TARGET, DEFAULT_CHARGE_TARGET)
+        self._snapshots = async_get_snapshot_store(hass)
+        self._range.load(self._snapshots.get_model(entry.entry_id, "range") or {})
+        self._last_reading: StoredSnapshot | None = None
+        # Published while the bike is out of reach: the last reading, marked unavailable
+        self._absent = ABSENT
+        self._notified_data: BikeSnapshot | None = None
+        self._changed_fields: frozenset[str] = frozenset()
+        self._notified_success = True
+        self._notified_charging = False
+        # True when the latest listener update flipped last_update_success
+        self._success_changed = False
+        self._read_slots = asyncio.Semaphore(MAX_CONCURRENT_GATT_READS)
+        self._battery_history: deque[int] = deque(maxlen=BATTERY_HISTORY_SIZE)
+        self._battery_full_unconfirmed = False
+        self._session = VanMoofSession(
+            hass,
+            entry.options.get(CONF_SESSION_IDLE_TIMEOUT, DEFAULT_SESSION_IDLE_TIMEOUT),
+            async_get_connection_arbiter(hass),
+            async_get_gatt_connector(hass),
+        )
+        self._presence = VanMoofPresence(
+            self._device_matches_bike,
+            self._async_presence_changed,
+            lambda: self._session.is_connected,
+        )
 
-            if not devices:
-                _LOGGER.debug("No Bluetooth devices discovered; marking VanMoof bike as not home.")
-                return self._not_home_data()
+    @property
+    def presence(self) -> VanMoofPresence:
+        """Return the advertisement-driven presence tracker for this bike."""
+        return self._presence
+
+    @property
+    def circuit_breaker(self) -> BikeCircuitBreaker:
+        """Return the circuit breaker guarding polls of this bike."""
+        return self._circuit_breaker
+
+    @property
+    def source_scores(self) -> SourceScoreboard:
+        """Return the rolling scores of the adapters and proxies that reach this bike."""
+        return self._source_scores
+
+    @property
+    def refresh_timings(self) -> RefreshTimings:
+        """Return the rolling per-phase refresh timings of this bike."""
+        return self._timings
+
+    @property
+    def telemetry(self) -> BikeTelemetry:
+        """Return the in-memory history of this bike's readings."""
+        return self._telemetry
+
+    @property
+    def range_estimator(self) -> RangeEstimator:
+        """Return the learned km per battery percent of this bike."""
+        return self._range
+
+    @property
+    def charge_sessions(self) -> ChargeSessionTracker:
+        """Return the charge session tracker of this bike."""
+        return self._charge
+
+    @property
+    def charge_target(self) -> int:
+        """Return the battery percent the time-to-target sensor counts towards."""
+        return self._charge_target
+
+    @property
+    def connection_queue_depth(self) -> int:
+        """Return how many connections wait for a free adapter slot across all bikes."""
+        return async_get_connection_arbiter(self.hass).queue_depth()
+
+    @property
+    def changed_fields(self) -> frozenset[str]:
+        """Return the data fields that changed with the latest listener update."""
+        return self._changed_fields
+
+    @property
+    def last_reading(self) -> datetime | None:
+        """Return when the bike was last read, including readings restored from storage."""
+        return self._last_reading.updated if self._last_reading else None
+
+    @property
+    def stale(self) -> bool:
+        """Return True while the data is the last reading of a bike that is out of reach."""
+        return self.data is not None and not self.data.available and self._last_reading is not None
+
+    def fields_changed(self, fields: tuple[str, ...] | None) -> bool:
+        """Return True when an entity depending on ``fields`` must write its state."""
+        return (
+            fields is None
+            or not self._changed_fields.isdisjoint(fields)
+            or "available" in self._changed_fields
+            or self._success_changed
+        )
 
-            bike_device = self._find_bike_device(devices)
+    @callback
+    def async_update_listeners(self) -> None:
+        """Diff the data against the last update so entities can skip unchanged state."""
+        previous, self._notified_data = self._notified_data, self.data
+        # Entities also write when a refresh fails or recovers without changing the data.
+        self._success_changed = self.last_update_success != self._notified_success
+        self._notified_success = self.last_update_success
+        if self.data is None:
+            self._changed_fields = FIELD_NAMES
+        else:
+            self._changed_fields = self.data.changed_fields(previous)
+            # Sessions also end on a stall or a ride, which no charging field shows.
+            if self._charge.charging != self._notified_charging:
+                self._notified_charging = self._charge.charging
+                self._changed_fields |= {CHARGE_SESSION_FIELD}
+            # Failed refreshes notify again with the data they kept; that is no new reading.
+            if self.data.available and self.data is not previous:
+                self._last_reading = self._snapshots.async_set(self._entry.entry_id, self.data)
+                self._telemetry.add(self.data)
+                if self._range.add(self.data):
+                    self._snapshots.async_set_model(self._entry.entry_id, "range", self._range.as_dict())
+                if self._changed_fields:
+                    self._absent = self.data.replace(available=False, present=False)
+        super().async_update_listeners()
+
+    @callback
+    def async_restore_snapshot(self) -> bool:
+        """
+        Start from the last stored reading of this bike, if there is one.
+
+        The reading is published as unavailable and not present until the next
+        advertisement or refresh reaches the bike.
+        """
+        reading = self._snapshots.get(self._entry.entry_id)
+        if reading is None:
+            return False
+        self._last_reading = reading
+        self.data = self._absent = reading.snapshot.replace(available=False, present=False)
+        if reading.snapshot.battery_level is not None:
+            # Check the first reading after a restart against the stored one.
+            self._battery_history.append(reading.snapshot.battery_level)
+        return True
+
+    async def async_start(self) -> None:
+        """Subscribe to bike advertisements from the shared scan broker."""
+        await async_get_scan_broker(self.hass).async_subscribe(self._presence)
+
+    async def async_shutdown(self) -> None:
+        """Stop listening for advertisements and shut down the coordinator."""
+        await async_get_scan_broker(self.hass).async_unsubscribe(self._presence)
+        await self._session.async_close()
+        await super().async_shutdown()
+
+    @callback
+    def _async_presence_changed(self, present: bool) -> None:
+        """Flip presence as soon as advertisements start or stop."""
+        if not present:
+            self._schedule_next_poll(self._absent)
+            self.async_set_updated_data(self._absent)
+            return
+
+        self._circuit_breaker.reset()
+        data = self.data or self._absent
+        if not data.present:
+            self.async_set_updated_data(data.replace(present=True))
+        self.hass.async_create_task(self.async_request_refresh())
+
+    def _schedule_next_poll(self, data: BikeSnapshot) -> None:
+        """Adapt the polling interval to the bike state."""
+        update_interval = self._scheduler.next_interval(
+            data, self._charge.poll_interval(self._charge_target)
+        )
+        if self._circuit_breaker.is_open:
+            # Try again as soon as the circuit allows it.
+            update_interval = timedelta(
+                seconds=max(self._circuit_breaker.retry_in, MIN_POLLING_INTERVAL)
+            )
+        if update_interval != self.update_interval:
+            _LOGGER.debug("Next VanMoof poll for %s in %s.", self._mac_address, update_interval)
+            self.update_interval = update_interval
+
+    async def _async_update_data(self) -> BikeSnapshot:
+        """Fetch data from the bike via BLE and adapt the polling interval to it."""
+        if self._circuit_breaker.is_open:
+            _LOGGER.debug(
+                "VanMoof bike %s unreachable; skipping poll for another %.0f seconds.",
+                self._mac_address,
+                self._circuit_breaker.retry_in,
+            )
+            # Keep the last reading; whether the bike is around is up to its advertisements.
+            data = self._with_presence(self.data or self._absent)
+            self._schedule_next_poll(data)
+            return data
+
+        self._timings.begin_refresh()
+        started = time.monotonic()
+        try:
+            data = await self._async_fetch_data()
+        except UpdateFailed as err:
+            self._timings.record_refresh(time.monotonic() - started, False)
+            if isinstance(err, BikeUnreachable):
+                self._circuit_breaker.record_failure()
+            # Retry at the interval of the last reading; the bike is still around.
+            self._schedule_next_poll(self._with_presence(self.data or self._absent))
+            raise
+
+        elapsed = time.monotonic() - started
+        self._timings.record_refresh(elapsed, data.present)
+        if data.available:
+            self._charge.add(data)
+        _LOGGER.debug(
+            "VanMoof refresh of %s took %.3fs (%s).",
+            self._mac_address,
+            elapsed,
+            self._timings.summary(),
+        )
+        if data.present:
+            self._circuit_breaker.record_success()
+        else:
+            self._circuit_breaker.record_failure()
+            data = self._with_presence(self._absent)
+        self._schedule_next_poll(data)
+        return data
+
+    def _with_presence(self, data: BikeSnapshot) -> BikeSnapshot:
+        """Return ``data`` marked present or not as the bike's advertisements show."""
+        present = self._presence.present
+        return data if data.present == present else data.replace(present=present)
+
+    async def _async_fetch_data(self) -> BikeSnapshot:
+        """Fetch data from the bike via BLE."""
+        try:
+            if self._presence.last_seen is None:
+                with self._timings.phase("scan"):
+                    await self._presence.async_wait_seen(PRESENCE_STARTUP_WAIT)
 
-            if not bike_device:
-                _LOGGER.debug("VanMoof bike with MAC %s not found; marking as not home.", self._mac_address)
-                return self._not_home_data()
+            with self._timings.phase("match"):
+                candidates = self._find_bike_devices()
 
-            try:
-                client = await connect_bleak_client(bike_device)
-            except Exception as err:
+            if not candidates:
                 _LOGGER.debug(
-                    "Unable to connect to VanMoof bike %s; marking as not home: %s",
+                    "VanMoof bike with MAC %s not found by a connectable adapter or proxy.",
                     self._mac_address,
-                    err,
                 )
-                return self._not_home_data()
+                return ABSENT
 
             try:
-                if not client.is_connected:
-                    _LOGGER.debug("Unable to connect to VanMoof bike %s; marking as not home.", self._mac_address)
-                    return self._not_home_data()
+                client = await self._async_connect_best_source(candidates)
+            except ConnectionSlotTimeout:
+                # Other bikes held the adapter; that says nothing about this one.
+                raise
+            except Exception as err:
+                raise BikeUnreachable(f"Unable to connect to VanMoof bike {self._mac_address}: {err}") from err
 
-                if _is_sx3_bike(self._vanmoof_type, self._bike_model):
-                    sx_client = SX3Client(client, self._encryption_key, self._user_key_id)
-                    await sx_client.authenticate()
-                    return await self._async_get_sx3_data(sx_client)
-
-                sx_client = SXClient(client, self._encryption_key)
-                try:
-                    parameters = await sx_client.get_parameters()
-                except Exception as err:
-                    if _is_missing_service_error(err):
-                        battery_level = await self._async_read_standard_battery(client)
-                        return self._s1_data(battery_level)
-                    raise
-                
-                # Convert lock_state enum
-                lock_state_map = {0: "UNLOCKED", 1: "LOCKED", 2: "AWAITING_UNLOCK"}
-                lock_state = lock_state_map.get(parameters.get("lock_state"), "UNKNOWN")
-                
-                # Convert module_state enum
-                module_state_map = {
-                    0: "ON", 1: "OFF", 2: "SHIPPING", 3: "STANDBY",
-                    4: "ALARM_ONE", 5: "ALARM_TWO", 6: "ALARM_THREE", 7: "SLEEPING", 8: "TRACKING"
-                }
-                module_state = module_state_map.get(parameters.get("module_state"), "UNKNOWN")
-                
-                light_mode_map = {0: "AUTO", 1: "ON", 2: "OFF", 3: "REAR_FLASH", 4: "REAR_FLASH_OFF"}
-                light_mode = light_mode_map.get(parameters.get("light_mode"), "UNKNOWN")
-                
-                return {
-                    "available": True,
-                    "present": True,
-                    "battery_level": parameters.get("battery_level"),
-                    "module_level": parameters.get("module_level"),
-                    "lock_state": lock_state,
-                    "distance_travelled": parameters.get("distance"),
-                    "power_level": parameters.get("power_level"),
-                    "region": parameters.get("region"),
-                    "light_mode": light_mode,
-                    "module_state": module_state,
-                    "charging": parameters.get("charging"),
-                    "errors": parameters.get("error_code"),
-                }
-            finally:
-                try:
-                    await client.disconnect()
-                except Exception:
-                    pass
+            if not client.is_connected:
+                await self._session.async_close()
+                raise BikeUnreachable(f"Unable to connect to VanMoof bike {self._mac_address}")
+
+            # A connected bike stops advertising; keep presence from expiring meanwhile.
+            self._presence.async_mark_seen()
+
+            try:
+                if not self._session.services_resolved:
+                    with self._timings.phase("resolve"):
+                        await self._session.async_resolve_services()
+                data = await self._async_read_bike(client)
+            except Exception:
+                with self._timings.phase("disconnect"):
+                    await self._session.async_close()
+                raise
+
+            if self._session.enabled:
+                await self._session.async_release()
+            else:
+                with self._timings.phase("disconnect"):
+                    await self._session.async_release()
+            return data
+        except UpdateFailed:
+            raise
         except Exception as e:
             _LOGGER.error(f"Error during bike data update: {e}")
             raise UpdateFailed(f"Error updating bike data: {e}")
 
-    def _not_home_data(self) -> dict[str, Any]:
-        """Build coordinator data when the bike is not currently reachable."""
-        return {
-            "available": False,
-            "present": False,
-            "battery_level": None,
-            "module_level": None,
-            "lock_state": None,
-            "distance_travelled": None,
-            "power_level": None,
-            "region": None,
-            "light_mode": None,
-            "module_state": None,
-            "charging": None,
-            "errors": None,
-            "speed": None,
-            "motor_battery_state": None,
-            "module_battery_state": None,
-        }
+    async def _async_subscribe_sx3(self, sx_client: SX3Client) -> None:
+        """Subscribe to S3/X3 push updates while the session keeps the link open."""
+        try:
+            await sx_client.subscribe(self._async_handle_notification)
+        except Exception as err:
+            _LOGGER.debug("VanMoof S3/X3 notifications are not available: %s", err)
+
+    @callback
+    def _async_handle_notification(self, name: str, value: Any) -> None:
+        """Merge a decoded S3/X3 notification into the coordinator data."""
+        if name == "lock_state":
+            value = _enum_name(value)
+        elif name == "battery_level":
+            value = self._filter_battery_level(value)
+
+        data = self.data or ABSENT
+        if getattr(data, name) == value:
+            return
+
+        _LOGGER.debug("VanMoof notification: %s = %s", name, value)
+        # Update listeners without async_set_updated_data, which would push back the
+        # next poll on every notification and starve the fields that do not notify.
+        self.data = data.replace(available=True, present=True, **{name: value})
+        self._charge.add(self.data)
+        self.async_update_listeners()
+
+    async def _async_read_bike(self, client) -> BikeSnapshot:
+        """Read bike data over a connected GATT client, authenticating if needed."""
+        if _is_sx3_bike(self._vanmoof_type, self._bike_model):
+            sx_client = self._session.bike_client
+            if sx_client is None:
+                sx_client = SX3Client(client, self._encryption_key, self._user_key_id)
+                with self._timings.phase("auth"):
+                    await sx_client.authenticate()
+                self._session.bike_client = sx_client
+                if self._session.enabled:
+                    await self._async_subscribe_sx3(sx_client)
+            with self._timings.phase("reads"):
+                return await self._async_get_sx3_data(sx_client)
+
+        sx_client = self._session.bike_client
+        if sx_client is None:
+            sx_client = SXClient(client, self._encryption_key)
+            self._session.bike_client = sx_client
+        try:
+            with self._timings.phase("reads"):
+                parameters = await sx_client.get_parameters()
+        except Exception as err:
+            if _is_missing_service_error(err):
+                with self._timings.phase("reads"):
+                    battery_level = await self._async_read_standard_battery(client)
+                return self._s1_data(battery_level)
+            raise
+
+        lock_state = _SX_LOCK_STATES.get(parameters.lock_state, "UNKNOWN")
+        module_state = _SX_MODULE_STATES.get(parameters.module_state, "UNKNOWN")
+        light_mode = _SX_LIGHT_MODES.get(parameters.light_mode, "UNKNOWN")
+
+        return BikeSnapshot(
+            available=True,
+            present=True,
+            battery_level=parameters.battery_level,
+            module_level=parameters.module_level,
+            lock_state=lock_state,
+            distance_travelled=parameters.distance,
+            power_level=parameters.power_level,
+            region=parameters.region,
+            light_mode=light_mode,
+            module_state=module_state,
+            charging=parameters.charging,
+            errors=parameters.error_code,
+        )
 
     async def _async_read_standard_battery(self, client) -> int | None:
         """Read the standard BLE battery characteristic when an older bike exposes it."""
@@ -221,178 +528,169 @@ class VanMoofDataUpdateCoordinator(DataUpdateCoordinator):
             return None
         return int(data[0])
 
-    def _s1_data(self, battery_level: int | None) -> dict[str, Any]:
+    def _s1_data(self, battery_level: int | None) -> BikeSnapshot:
         """Build coordinator data for bikes without the SX/S3 encrypted services."""
-        return {
-            "available": True,
-            "present": True,
-            "battery_level": battery_level,
-            "module_level": None,
-            "lock_state": None,
-            "distance_travelled": None,
-            "power_level": None,
-            "region": None,
-            "light_mode": None,
-            "module_state": None,
-            "charging": None,
-            "errors": None,
-            "speed": None,
-            "motor_battery_state": None,
-            "module_battery_state": None,
-        }
-
-    async def _async_read_optional(
-        self,
-        name: str,
-        reader: Callable[[], Awaitable[Any]],
-    ) -> Any:
-        """Read an optional SX3/X3 characteristic without failing the whole update."""
-        try:
-            return await reader()
-        except Exception as err:
-            _LOGGER.debug("Unable to read optional VanMoof S3/X3 value %s: %s", name, err)
-            return None
-
-    async def _async_get_sx3_battery_level(self, sx_client: SX3Client) -> int:
-        """Read S3/X3 battery level with a retry for occasional false 100% reports."""
-        battery_level = await sx_client.get_battery_level()
-        if battery_level != 100:
+        return BikeSnapshot(available=True, present=True, battery_level=battery_level)
+
+    async def _async_read_limited(self, reader: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a characteristic read while holding one of the in-flight read slots."""
+        async with self._read_slots:
+            with self._timings.phase("read"):
+                return await reader()
+
+    def _filter_battery_level(self, battery_level: int | None) -> int | None:
+        """
+        Check a battery reading against recent history before accepting it.
+
+        S3/X3 bikes occasionally report 100% for a single read. A jump to 100% from
+        a clearly lower level is only accepted during a charge session, or when the
+        next read (next poll or notification) confirms it; until then the last
+        plausible level is kept.
+        """
+        history = self._battery_history
+        if (
+            battery_level != 100
+            or not history
+            or self._charge.charging
+            or history[-1] >= BATTERY_FULL_PLAUSIBLE_FROM
+            or self._battery_full_unconfirmed
+        ):
+            self._battery_full_unconfirmed = False
+            if battery_level is not None:
+                history.append(battery_level)
             return battery_level
 
-        for _ in range(2):
-            await asyncio.sleep(5)
-            battery_level = await sx_client.get_battery_level()
-            if battery_level < 100:
-                return battery_level
-        return battery_level
+        _LOGGER.debug(
+            "Ignoring implausible VanMoof battery level 100%% after %s%%; rechecking on the next read.",
+            history[-1],
+        )
+        self._battery_full_unconfirmed = True
+        return history[-1]
 
-    async def _async_get_sx3_data(self, sx_client: SX3Client) -> dict[str, Any]:
+    async def _async_get_sx3_data(self, sx_client: SX3Client) -> BikeSnapshot:
         """Fetch S3/X3 data, keeping the core pymoof-compatible reads mandatory."""
-        battery_level = await self._async_get_sx3_battery_level(sx_client)
-        lock_state = await sx_client.get_lock_state()
-        distance_travelled = await sx_client.get_distance_travelled()
-
-        return {
-            "available": True,
-            "present": True,
-            "battery_level": battery_level,
-            "module_level": await self._async_read_optional(
-                "module_level", sx_client.get_module_battery_level
-            ),
-            "lock_state": _enum_name(lock_state),
-            "distance_travelled": distance_travelled,
-            "power_level": _to_int(
-                await self._async_read_optional("power_level", sx_client.get_power_level)
-            ),
-            "speed": await self._async_read_optional("speed", sx_client.get_speed),
-            "region": None,
-            "light_mode": await self._async_read_optional(
-                "light_mode", sx_client.get_light_mode
-            ),
-            "module_state": await self._async_read_optional(
-                "module_state", sx_client.get_module_state
-            ),
-            "charging": None,
-            "errors": await self._async_read_optional("errors", sx_client.get_errors),
-            "motor_battery_state": await self._async_read_optional(
-                "motor_battery_state", sx_client.get_motor_battery_state
-            ),
-            "module_battery_state": await self._async_read_optional(
-                "module_battery_state", sx_client.get_module_battery_state
-            ),
-        }
-
-    async def _async_update_direct(self):
-        """Fetch data directly from the bike via Bleak when proxy helpers are unavailable."""
-        devices = await BleakScanner.discover(timeout=8.0)
-        _LOGGER.debug("Discovered %s BLE devices while searching for VanMoof bike.", len(devices))
-
-        if not devices:
-            return self._not_home_data()
-
-        bike_device = self._find_bike_device(devices)
-
-        if not bike_device:
-            return self._not_home_data()
-
-        try:
-            client = await connect_bleak_client(bike_device)
-        except Exception:
-            return self._not_home_data()
-
-        try:
-            if not client.is_connected:
-                return self._not_home_data()
+        mandatory = ("battery_level", "lock_state", "distance_travelled")
+        optional = (
+            "module_level",
+            "power_level",
+            "speed",
+            "light_mode",
+            "module_state",
+            "errors",
+            "motor_battery_state",
+            "module_battery_state",
+        )
 
-            if _is_sx3_bike(self._vanmoof_type, self._bike_model):
-                sx_client = SX3Client(client, self._encryption_key, self._user_key_id)
-                await sx_client.authenticate()
-                return await self._async_get_sx3_data(sx_client)
+        # Issue the independent reads together; the read slots bound how many are in flight.
+        values = await sx_client.get_many(
+            [*mandatory, *optional],
+            limiter=self._async_read_limited,
+        )
+        for name in mandatory:
+            if isinstance(values[name], BaseException):
+                raise values[name]
+        for name in optional:
+            if isinstance(values[name], BaseException):
+                _LOGGER.debug("Unable to read optional VanMoof S3/X3 value %s: %s", name, values[name])
+                values[name] = None
+
+        return BikeSnapshot(
+            available=True,
+            present=True,
+            battery_level=self._filter_battery_level(values["battery_level"]),
+            module_level=values["module_level"],
+            lock_state=_enum_name(values["lock_state"]),
+            distance_travelled=values["distance_travelled"],
+            power_level=_to_int(values["power_level"]),
+            speed=values["speed"],
+            light_mode=values["light_mode"],
+            module_state=values["module_state"],
+            errors=values["errors"],
+            motor_battery_state=values["motor_battery_state"],
+            module_battery_state=values["module_battery_state"],
+        )
 
-            sx_client = SXClient(client, self._encryption_key)
+    def _find_bike_devices(self) -> list[tuple[str, Any]]:
+        """
+        Return ``(source, device)`` connection candidates for the bike, best first.
+
+        Presence comes from the live advertisement table. Every connectable
+        adapter or proxy that sees the bike is a candidate, ranked by its rolling
+        score of RSSI, connect time and failure rate.
+        """
+        device = self._presence.device
+        if device is None:
+            return []
+
+        candidates = async_connectable_candidates(
+            self.hass,
+            (getattr(device, "address", None), self._ble_address, self._mac_address),
+        )
+        for source, _device, rssi in candidates:
+            self._source_scores.record_rssi(source, rssi)
+        return self._source_scores.rank(candidates)
+
+    async def _async_connect_best_source(self, candidates: list[tuple[str, Any]]):
+        """Connect through the best-scoring source, falling through to the next on failure."""
+        if self._session.is_connected:
+            return await self._session.async_connect(candidates[0][1])
+
+        if len(candidates) == 1:
+            # A single path: let bleak-retry-connector retry and re-resolve it.
+            source, device = candidates[0]
+            return await self._async_connect_source(
+                source,
+                device,
+                async_ble_device_callback(self.hass, device),
+                DEFAULT_CONNECT_ATTEMPTS,
+            )
+
+        last_err: Exception | None = None
+        for source, device in candidates:
             try:
-                parameters = await sx_client.get_parameters()
+                return await self._async_connect_source(source, device, None, 1)
             except Exception as err:
-                if _is_missing_service_error(err):
-                    battery_level = await self._async_read_standard_battery(client)
-                    return self._s1_data(battery_level)
-                raise
-            
-            lock_state_map = {0: "UNLOCKED", 1: "LOCKED", 2: "AWAITING_UNLOCK"}
-            lock_state = lock_state_map.get(parameters.get("lock_state"), "UNKNOWN")
-
-            module_state_map = {
-                0: "ON", 1: "OFF", 2: "SHIPPING", 3: "STANDBY",
-                4: "ALARM_ONE", 5: "ALARM_TWO", 6: "ALARM_THREE", 7: "SLEEPING", 8: "TRACKING"
-            }
-            module_state = module_state_map.get(parameters.get("module_state"), "UNKNOWN")
-
-            light_mode_map = {0: "AUTO", 1: "ON", 2: "OFF", 3: "REAR_FLASH", 4: "REAR_FLASH_OFF"}
-            light_mode = light_mode_map.get(parameters.get("light_mode"), "UNKNOWN")
-
-            return {
-                "available": True,
-                "present": True,
-                "battery_level": parameters.get("battery_level"),
-                "module_level": parameters.get("module_level"),
-                "lock_state": lock_state,
-                "distance_travelled": parameters.get("distance"),
-                "power_level": parameters.get("power_level"),
-                "region": parameters.get("region"),
-                "light_mode": light_mode,
-                "module_state": module_state,
-                "charging": parameters.get("charging"),
-                "errors": parameters.get("error_code"),
-            }
-        finally:
-            try:
-                await client.disconnect()
-            except Exception:
-                pass
+                _LOGGER.debug("Connecting to VanMoof bike via %s failed: %s", source, err)
+                last_err = err
+        raise last_err
 
-    def _find_bike_device(self, devices):
-        """Find the bike by stored BLE address, API MAC, or advertised name prefix."""
-        for device in devices:
-            device_address = getattr(device, "address", "")
-            if self._ble_address and device_address.lower() == self._ble_address.lower():
-                return device
-            if device_address.lower() == self._mac_address.lower():
-                return device
+    async def _async_connect_source(self, source: str, device, ble_device_callback, max_attempts: int):
+        """Connect through one source and record the outcome in its score and timings."""
+        started = time.monotonic()
+        try:
+            client = await self._session.async_connect(device, ble_device_callback, max_attempts)
+        except ConnectionSlotTimeout:
+            raise
+        except Exception:
+            self._timings.record("connect", time.monotonic() - started)
+            self._source_scores.record_failure(source)
+            raise
+        elapsed = time.monotonic() - started
+        self._timings.record("connect", elapsed)
+        self._source_scores.record_connect(source, elapsed)
+        return client
+
+    def _device_matches_bike(self, device) -> bool:
+        """Match a device by stored BLE address, API MAC, or advertised name prefix."""
+        device_address = getattr(device, "address", "").lower()
+        if self._ble_address and device_address == self._ble_address.lower():
+            return True
+        if device_address == self._mac_address.lower():
+            return True
 
         api_mac = _compact_mac(self._mac_address)
         if len(api_mac) < 4:
-            return None
-
-        for device in devices:
-            device_name = (getattr(device, "name", "") or "").upper()
-            if api_mac[:4] in device_name:
-                _log_possible_mac_mismatch(device, self._mac_address)
-                _LOGGER.debug(
-                    "Matched bike by advertised name prefix: %s (%s) for API MAC %s",
-                    device_name,
-                    getattr(device, "address", ""),
-                    self._mac_address,
-                )
-                return device
-
-        return None
+            return False
+
+        device_name = (getattr(device, "name", "") or "").upper()
+        if api_mac[:4] in device_name:
+            _log_possible_mac_mismatch(device, self._mac_address)
+            _LOGGER.debug(
+                "Matched bike by advertised name prefix: %s (%s) for API MAC %s",
+                device_name,
+                getattr(device, "address", ""),
+                self._mac_address,
+            )
+            return True
+
+        return False